@@ -7,6 +7,8 @@ Orchestrates multiple AI models for intelligent decision-making:
 """
 import os
 import json
+import threading
+from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from functools import lru_cache
 import google.generativeai as genai
@@ -16,6 +18,109 @@ GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
 if GEMINI_API_KEY:
     genai.configure(api_key=GEMINI_API_KEY)
 
+# Static validation instructions, sent once as the model's system instruction
+# so per-call prompts only carry the metrics and cards
+VALIDATION_SYSTEM_INSTRUCTION = """You are a sustainability expert evaluating decisions for an organization.
+Metrics use a 0-100 scale. For waste, emissions, and cost lower is better; for efficiency, community trust, and the overall score higher is better.
+For each decision, judge how relevant it is given the current metrics and why it is or is not important right now.
+Return confidence (0.0-1.0), reasoning (under 100 words), and priority_level (critical, high, medium, or low).
+When several numbered decisions are given, return one entry per decision including its index."""
+
+# Structured output contract for card validation (guarantees raw JSON)
+VALIDATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "confidence": {"type": "number"},
+        "reasoning": {"type": "string"},
+        "priority_level": {"type": "string", "enum": ["critical", "high", "medium", "low"]}
+    },
+    "required": ["confidence", "reasoning"]
+}
+VALIDATION_CONFIG = genai.GenerationConfig(
+    response_mime_type="application/json",
+    response_schema=VALIDATION_SCHEMA
+)
+
+# Multi-card variant: one entry per card, matched back by 1-based index
+BATCH_VALIDATION_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "index": {"type": "integer"},
+            **VALIDATION_SCHEMA["properties"]
+        },
+        "required": ["index", "confidence", "reasoning"]
+    }
+}
+BATCH_VALIDATION_CONFIG = genai.GenerationConfig(
+    response_mime_type="application/json",
+    response_schema=BATCH_VALIDATION_SCHEMA
+)
+
+# Quantized ESG-BERT export (see api/export_esg_onnx.py)
+ESG_ONNX_DIR = Path(__file__).parent / "onnx"
+ESG_ONNX_PATH = ESG_ONNX_DIR / "esg-bert-int8.onnx"
+
+
+class OnnxESGClassifier:
+    """
+    Int8 ESG-BERT served through ONNX Runtime
+
+    Callable with the same arguments and output shape as the
+    transformers text-classification pipeline it replaces.
+    """
+
+    def __init__(self, model_path: Path = ESG_ONNX_PATH):
+        """Create the inference session and load tokenizer/labels from the export dir"""
+        import onnxruntime as ort
+        from transformers import AutoConfig, AutoTokenizer
+
+        sess_options = ort.SessionOptions()
+        sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(
+            str(model_path),
+            sess_options,
+            providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {i.name for i in self.session.get_inputs()}
+        self.tokenizer = AutoTokenizer.from_pretrained(model_path.parent)
+        self.id2label = AutoConfig.from_pretrained(model_path.parent).id2label
+
+    def __call__(
+        self,
+        texts: List[str],
+        batch_size: int = 32,
+        truncation: bool = True,
+        max_length: int = 512
+    ) -> List[Dict[str, float]]:
+        """Tokenize, run the session, and return the top label per text"""
+        import numpy as np
+
+        if isinstance(texts, str):
+            texts = [texts]
+
+        results = []
+        for start in range(0, len(texts), batch_size):
+            encoded = self.tokenizer(
+                texts[start:start + batch_size],
+                padding=True,
+                truncation=truncation,
+                max_length=max_length,
+                return_tensors="np"
+            )
+            feed = {k: v.astype(np.int64) for k, v in encoded.items() if k in self.input_names}
+            logits = self.session.run(None, feed)[0]
+
+            # Softmax -> argmax
+            exp = np.exp(logits - logits.max(axis=-1, keepdims=True))
+            probs = exp / exp.sum(axis=-1, keepdims=True)
+            for row in probs:
+                idx = int(row.argmax())
+                results.append({'label': self.id2label[idx], 'score': float(row[idx])})
+
+        return results
+
 
 class AIDecisionEngine:
     """
@@ -32,28 +137,67 @@ class AIDecisionEngine:
         # Gemini LLM
         self.gemini_model = None
         if GEMINI_API_KEY:
-            self.gemini_model = genai.GenerativeModel('gemini-2.0-flash-exp')
+            self.gemini_model = genai.GenerativeModel(
+                'gemini-2.0-flash-exp',
+                system_instruction=VALIDATION_SYSTEM_INSTRUCTION
+            )
 
-        # ESG-BERT classifier (lazy loaded)
+        # ESG-BERT classifier (lazy loaded, warmed up in the background)
         self._esg_classifier = None
+        self._esg_loaded = False
+        self._esg_lock = threading.Lock()
+        threading.Thread(target=self._warm_up, name="esg-bert-warmup", daemon=True).start()
+
+        # Gemini validations keyed on (card id(s), quantized metrics)
+        self._validate_cached = lru_cache(maxsize=2048)(self._query_gemini)
+        self._validate_batch_cached = lru_cache(maxsize=512)(self._query_gemini_batch)
 
     @property
     def esg_classifier(self):
-        """Lazy load ESG-BERT model (heavy, only load when needed)"""
-        if self._esg_classifier is None:
+        """
+        Lazy load ESG-BERT model (heavy, loaded once and thread-safe)
+
+        Prefers the int8 ONNX export when it exists and onnxruntime is
+        installed; otherwise falls back to the FP32 transformers pipeline.
+        """
+        if self._esg_loaded:
+            return self._esg_classifier
+
+        with self._esg_lock:
+            # Another thread may have finished loading while we waited
+            if not self._esg_loaded:
+                self._esg_classifier = self._load_esg_classifier()
+                self._esg_loaded = True
+        return self._esg_classifier
+
+    def _load_esg_classifier(self):
+        """Load the ONNX or pipeline ESG-BERT classifier (None if unavailable)"""
+        if ESG_ONNX_PATH.exists():
             try:
-                from transformers import pipeline
-                print("Loading ESG-BERT model...")
-                self._esg_classifier = pipeline(
-                    "text-classification",
-                    model="nbroad/ESG-BERT",
-                    device=-1  # CPU (set to 0 for GPU)
-                )
+                print("Loading ESG-BERT (ONNX int8)...")
+                classifier = OnnxESGClassifier(ESG_ONNX_PATH)
                 print("ESG-BERT loaded successfully")
+                return classifier
             except Exception as e:
-                print(f"Warning: Could not load ESG-BERT: {e}")
-                self._esg_classifier = None
-        return self._esg_classifier
+                print(f"Warning: Could not load ONNX ESG-BERT, using pipeline: {e}")
+
+        try:
+            from transformers import pipeline
+            print("Loading ESG-BERT model...")
+            classifier = pipeline(
+                "text-classification",
+                model="nbroad/ESG-BERT",
+                device=-1  # CPU (set to 0 for GPU)
+            )
+            print("ESG-BERT loaded successfully")
+            return classifier
+        except Exception as e:
+            print(f"Warning: Could not load ESG-BERT: {e}")
+            return None
+
+    def _warm_up(self):
+        """Load ESG-BERT ahead of the first request so it doesn't stall a user call"""
+        self.esg_classifier
 
     def classify_sustainability_category(self, text: str) -> Dict[str, float]:
         """
@@ -65,28 +209,55 @@ class AIDecisionEngine:
         Returns:
             Dict with category and confidence score
         """
+        return self.classify_sustainability_category_batch([text])[0]
+
+    def classify_sustainability_category_batch(self, texts: List[str]) -> List[Dict[str, float]]:
+        """
+        Classify several texts with a single ESG-BERT pipeline call
+
+        The pipeline batches the inputs internally, so N cards cost one
+        tokenizer/forward pass instead of N.
+
+        Args:
+            texts: Decision texts to classify
+
+        Returns:
+            List of dicts with category and confidence score (same order as texts)
+        """
+        fallback = {'label': 'Environmental', 'score': 0.5}
+        if not texts:
+            return []
         if self.esg_classifier is None:
-            return {'label': 'Environmental', 'score': 0.5}  # Fallback
+            return [dict(fallback) for _ in texts]
 
         try:
-            result = self.esg_classifier(text[:512])  # Limit token length
-            return {
-                'label': result[0]['label'],
-                'score': result[0]['score']
-            }
+            results = self.esg_classifier(
+                texts,
+                batch_size=32,
+                truncation=True,
+                max_length=512  # Limit token length
+            )
+            return [
+                {'label': result['label'], 'score': result['score']}
+                for result in results
+            ]
         except Exception as e:
             print(f"ESG-BERT classification error: {e}")
-            return {'label': 'Environmental', 'score': 0.5}
+            return [dict(fallback) for _ in texts]
 
     def validate_card_with_gemini(
         self,
         card: dict,
         metrics: dict,
-        max_retries: int = 2
+        max_retries: int = 1
     ) -> Dict[str, any]:
         """
         Use Gemini to validate and enhance card selection
 
+        Results are cached per (card id, metrics rounded to the nearest 5),
+        so near-identical states reuse the previous evaluation instead of
+        issuing another Gemini round-trip.
+
         Args:
             card: Decision card to validate
             metrics: Current sustainability metrics
@@ -96,78 +267,147 @@ class AIDecisionEngine:
             Dict with confidence, reasoning, and priority
         """
         if self.gemini_model is None:
-            return {
-                'confidence': 0.5,
-                'reasoning': 'Gemini not available',
-                'priority_level': 'medium'
-            }
-
-        prompt = f"""You are a sustainability expert evaluating a decision.
-
-Current Sustainability Metrics (0-100 scale):
-- Waste: {metrics['waste']}/100 (lower is better)
-- Emissions: {metrics['emissions']}/100 (lower is better)
-- Cost: {metrics['cost']}/100 (lower is better)
-- Efficiency: {metrics['efficiency']}/100 (higher is better)
-- Community Trust: {metrics['communityTrust']}/100 (higher is better)
-- Overall Score: {metrics['sustainabilityScore']}/100
-
-Decision to Evaluate:
-Title: {card['title']}
-Question: {card['prompt']}
-Tags: {', '.join(card.get('tags', []))}
-Severity: {card.get('severity', 'medium')}
-
-Analyze this decision:
-1. How relevant is it given the current metrics? (0.0-1.0)
-2. Why is it important or not important right now?
-3. What is the priority level?
-
-Return ONLY valid JSON (no markdown):
-{{
-    "confidence": 0.85,
-    "reasoning": "brief explanation under 100 words",
-    "priority_level": "critical|high|medium|low"
-}}"""
+            return _unavailable_validation()
 
+        metrics_key = _metrics_key(metrics)
+        card_json = json.dumps(_prompt_fields(card))
+
+        try:
+            # Deserialize outside the cache so callers never share a dict
+            return json.loads(
+                self._validate_cached(card['id'], metrics_key, card_json, max_retries)
+            )
+        except Exception:
+            # Final fallback (failures are not cached, so the next call retries)
+            return _fallback_validation(card)
+
+    def _query_gemini(
+        self,
+        card_id: str,
+        metrics_key: tuple,
+        card_json: str,
+        max_retries: int
+    ) -> str:
+        """
+        Run the Gemini validation prompt (wrapped by the LRU cache in __init__)
+
+        Args:
+            card_id: Card identifier (part of the cache key)
+            metrics_key: Quantized ((metric, value), ...) pairs
+            card_json: JSON-encoded title/prompt/tags/severity of the card
+            max_retries: Number of retry attempts
+
+        Returns:
+            JSON-encoded validation result
+
+        Raises:
+            Exception: The last error if every attempt failed
+        """
+        prompt = _validation_prompt(json.loads(card_json), dict(metrics_key))
+
+        last_error = None
         for attempt in range(max_retries):
             try:
-                response = self.gemini_model.generate_content(prompt)
-                text = response.text.strip()
-
-                # Remove markdown code blocks if present
-                if text.startswith('```json'):
-                    text = text[7:]
-                if text.startswith('```'):
-                    text = text[3:]
-                if text.endswith('```'):
-                    text = text[:-3]
-                text = text.strip()
-
-                result = json.loads(text)
-
-                # Validate result
-                if 'confidence' in result and 'reasoning' in result:
-                    # Clamp confidence to 0-1 range
-                    result['confidence'] = max(0.0, min(1.0, float(result['confidence'])))
-                    return result
+                response = self.gemini_model.generate_content(
+                    prompt,
+                    generation_config=VALIDATION_CONFIG
+                )
+                return json.dumps(_parse_validation(response.text))
 
             except Exception as e:
                 print(f"Gemini validation attempt {attempt + 1} failed: {e}")
-                if attempt == max_retries - 1:
-                    # Final fallback
-                    return {
-                        'confidence': 0.5,
-                        'reasoning': f'Card addresses {", ".join(card.get("tags", []))}',
-                        'priority_level': 'medium'
-                    }
-
-        # Should never reach here, but just in case
-        return {
-            'confidence': 0.5,
-            'reasoning': 'Default reasoning',
-            'priority_level': 'medium'
-        }
+                last_error = e
+
+        raise last_error or ValueError("Gemini validation was not attempted")
+
+    def validate_cards_batch(
+        self,
+        cards: List[dict],
+        metrics: dict,
+        max_retries: int = 1
+    ) -> List[Dict[str, any]]:
+        """
+        Validate several cards with a single Gemini prompt
+
+        One round-trip scores every card (the metrics block is only sent
+        once). Cached per (card ids, metrics rounded to the nearest 5).
+        If Gemini fails or leaves a card out, every card gets the standard
+        fallback for this call only (failures are not cached).
+
+        Args:
+            cards: Decision cards to validate
+            metrics: Current sustainability metrics
+            max_retries: Number of retry attempts
+
+        Returns:
+            List of dicts with confidence, reasoning, and priority (same order as cards)
+        """
+        if self.gemini_model is None:
+            return [_unavailable_validation() for _ in cards]
+        if not cards:
+            return []
+
+        card_ids = tuple(card['id'] for card in cards)
+        cards_json = json.dumps([_prompt_fields(card) for card in cards])
+
+        try:
+            # Deserialize outside the cache so callers never share a dict
+            return json.loads(
+                self._validate_batch_cached(card_ids, _metrics_key(metrics), cards_json, max_retries)
+            )
+        except Exception:
+            # Final fallback (failures are not cached, so the next call retries)
+            return [_fallback_validation(card) for card in cards]
+
+    def _query_gemini_batch(
+        self,
+        card_ids: tuple,
+        metrics_key: tuple,
+        cards_json: str,
+        max_retries: int
+    ) -> str:
+        """
+        Run the multi-card validation prompt (wrapped by the LRU cache in __init__)
+
+        Args:
+            card_ids: Card identifiers (part of the cache key)
+            metrics_key: Quantized ((metric, value), ...) pairs
+            cards_json: JSON-encoded list of title/prompt/tags/severity per card
+            max_retries: Number of retry attempts
+
+        Returns:
+            JSON-encoded list with one result per card
+
+        Raises:
+            Exception: The last error if every attempt failed (a response
+                missing any card counts as a failure, so it is never cached)
+        """
+        cards = json.loads(cards_json)
+        prompt = _batch_validation_prompt(cards, dict(metrics_key))
+
+        last_error = None
+        for attempt in range(max_retries):
+            try:
+                response = self.gemini_model.generate_content(
+                    prompt,
+                    generation_config=BATCH_VALIDATION_CONFIG
+                )
+                results = _parse_validation_batch(response.text, len(cards))
+                missing = [i for i, result in enumerate(results, start=1) if result is None]
+                if missing:
+                    raise ValueError(f"Gemini batch response is missing cards {missing}")
+                return json.dumps(results)
+
+            except Exception as e:
+                print(f"Gemini batch validation attempt {attempt + 1} failed: {e}")
+                last_error = e
+
+        raise last_error or ValueError("Gemini validation was not attempted")
+
+    def clear_gemini_cache(self):
+        """Clear cached Gemini validations (useful for testing)."""
+        self._validate_cached.cache_clear()
+        self._validate_batch_cached.cache_clear()
 
     def enhance_card_selection(
         self,
@@ -191,69 +431,234 @@ Return ONLY valid JSON (no markdown):
         Returns:
             Tuple of (best_card, rationale, scoring_details)
         """
-        enhanced_cards = []
+        algo_scores = _pad_scores(top_cards, algorithm_scores)
 
-        for i, card in enumerate(top_cards):
-            # Get algorithm score
-            algo_score = algorithm_scores[i] if i < len(algorithm_scores) else 0
+        # ESG-BERT: classify every candidate in one batched pass
+        esg_results = self.classify_sustainability_category_batch(_esg_texts(top_cards))
 
-            # ESG-BERT classification (5% weight)
-            esg_result = self.classify_sustainability_category(
-                f"{card['title']}. {card['prompt']}"
-            )
-            esg_boost = esg_result['score'] * 5  # Max 5 points
+        # Gemini: score every candidate in one round-trip
+        gemini_results = self.validate_cards_batch(top_cards, metrics)
 
-            # Gemini validation (25% weight)
-            gemini_result = self.validate_card_with_gemini(card, metrics)
-            gemini_boost = gemini_result['confidence'] * 25  # Max 25 points
+        enhanced_cards = [
+            _combine_scores(card, algo_score, esg_result, gemini_result)
+            for card, algo_score, esg_result, gemini_result
+            in zip(top_cards, algo_scores, esg_results, gemini_results)
+        ]
 
-            # Combined score
-            final_score = (
-                algo_score * 0.70 +      # Algorithm 70%
-                gemini_boost +           # Gemini 25%
-                esg_boost                # ESG-BERT 5%
-            )
+        return _select_best(enhanced_cards)
+
+
+def _metrics_key(metrics: dict) -> tuple:
+    """Cache key for metrics: sorted (name, value rounded to the nearest 5) pairs"""
+    return tuple((k, round(metrics[k] / 5) * 5) for k in sorted(metrics))
+
+
+def _prompt_fields(card: dict) -> dict:
+    """The card fields that go into a validation prompt"""
+    return {
+        'title': card['title'],
+        'prompt': card['prompt'],
+        'tags': list(card.get('tags', [])),
+        'severity': card.get('severity', 'medium')
+    }
+
+
+def _metrics_block(metrics: dict) -> str:
+    """Current-metrics section shared by the validation prompts"""
+    return f"""Current metrics:
+- Waste: {metrics['waste']}
+- Emissions: {metrics['emissions']}
+- Cost: {metrics['cost']}
+- Efficiency: {metrics['efficiency']}
+- Community Trust: {metrics['communityTrust']}
+- Overall Score: {metrics['sustainabilityScore']}"""
+
+
+def _card_block(card: dict, indent: str = "") -> str:
+    """Card section of a validation prompt"""
+    return f"""Title: {card['title']}
+{indent}Question: {card['prompt']}
+{indent}Tags: {', '.join(card.get('tags', []))}
+{indent}Severity: {card.get('severity', 'medium')}"""
+
+
+def _validation_prompt(card: dict, metrics: dict) -> str:
+    """Build the Gemini prompt for validating one card against the metrics"""
+    return f"""{_metrics_block(metrics)}
+
+Decision:
+{_card_block(card)}"""
+
+
+def _batch_validation_prompt(cards: List[dict], metrics: dict) -> str:
+    """Build one Gemini prompt that validates every card against the metrics"""
+    decisions = "\n".join(
+        f"{i}. {_card_block(card, indent='   ')}"
+        for i, card in enumerate(cards, start=1)
+    )
 
-            enhanced_cards.append({
-                'card': card,
-                'algorithm_score': algo_score,
-                'esg_category': esg_result['label'],
-                'esg_confidence': esg_result['score'],
-                'gemini_confidence': gemini_result['confidence'],
-                'gemini_reasoning': gemini_result['reasoning'],
-                'gemini_priority': gemini_result['priority_level'],
-                'final_score': final_score
-            })
+    return f"""{_metrics_block(metrics)}
 
-        # Select best card
-        best = max(enhanced_cards, key=lambda x: x['final_score'])
+Decisions:
+{decisions}"""
+
+
+def _parse_validation(text: str) -> Dict[str, any]:
+    """
+    Parse and normalize a Gemini validation response
+
+    Raises:
+        ValueError: If the JSON is invalid or missing required fields
+    """
+    return _normalize_validation(json.loads(text), text)
+
+
+def _parse_validation_batch(text: str, count: int) -> List[Optional[Dict[str, any]]]:
+    """
+    Parse a multi-card Gemini response into per-card results by index
+
+    Returns:
+        List of `count` normalized results (None where a card is missing)
+
+    Raises:
+        ValueError: If the JSON is invalid or not an array
+    """
+    entries = json.loads(text)
+    if not isinstance(entries, list):
+        raise ValueError(f"Gemini batch response is not an array: {text[:100]}")
+
+    results = [None] * count
+    for entry in entries:
+        try:
+            index = int(entry['index'])
+            if 1 <= index <= count:
+                results[index - 1] = _normalize_validation(entry, text)
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"Skipping malformed Gemini batch entry: {e}")
+
+    return results
+
+
+def _normalize_validation(result: dict, text: str) -> Dict[str, any]:
+    """Check required fields, clamp confidence, and default the priority"""
+    # Validate result
+    if 'confidence' not in result or 'reasoning' not in result:
+        raise ValueError(f"Incomplete Gemini response: {text[:100]}")
+
+    # Clamp confidence to 0-1 range
+    result['confidence'] = max(0.0, min(1.0, float(result['confidence'])))
+    result.setdefault('priority_level', 'medium')
+    result.pop('index', None)
+    return result
+
+
+def _unavailable_validation() -> Dict[str, any]:
+    """Neutral validation used when Gemini is not configured"""
+    return {
+        'confidence': 0.5,
+        'reasoning': 'Gemini not available',
+        'priority_level': 'medium'
+    }
+
+
+def _fallback_validation(card: dict) -> Dict[str, any]:
+    """Neutral validation used when every Gemini attempt failed"""
+    return {
+        'confidence': 0.5,
+        'reasoning': f'Card addresses {", ".join(card.get("tags", []))}',
+        'priority_level': 'medium'
+    }
+
+
+def _pad_scores(top_cards: List[dict], algorithm_scores: List[float]) -> List[float]:
+    """Align algorithm scores with cards (missing scores count as 0)"""
+    return [
+        algorithm_scores[i] if i < len(algorithm_scores) else 0
+        for i in range(len(top_cards))
+    ]
+
+
+def _esg_texts(top_cards: List[dict]) -> List[str]:
+    """Texts fed to ESG-BERT for each card"""
+    return [f"{card['title']}. {card['prompt']}" for card in top_cards]
+
+
+def _combine_scores(
+    card: dict,
+    algo_score: float,
+    esg_result: Dict[str, float],
+    gemini_result: Dict[str, any]
+) -> dict:
+    """
+    Combine algorithm, ESG-BERT, and Gemini results for a single card
+
+    Returns:
+        Dict with the card, per-model results, and final score
+    """
+    # ESG-BERT classification (5% weight)
+    esg_boost = esg_result['score'] * 5  # Max 5 points
+
+    # Gemini validation (25% weight)
+    gemini_boost = gemini_result['confidence'] * 25  # Max 25 points
+
+    # Combined score
+    final_score = (
+        algo_score * 0.70 +      # Algorithm 70%
+        gemini_boost +           # Gemini 25%
+        esg_boost                # ESG-BERT 5%
+    )
+
+    return {
+        'card': card,
+        'algorithm_score': algo_score,
+        'esg_category': esg_result['label'],
+        'esg_confidence': esg_result['score'],
+        'gemini_confidence': gemini_result['confidence'],
+        'gemini_reasoning': gemini_result['reasoning'],
+        'gemini_priority': gemini_result['priority_level'],
+        'final_score': final_score
+    }
+
+
+def _select_best(enhanced_cards: List[dict]) -> Tuple[dict, str, dict]:
+    """
+    Pick the highest-scoring enhanced card and explain it
+
+    Returns:
+        Tuple of (best_card, rationale, scoring_details)
+    """
+    # Select best card
+    best = max(enhanced_cards, key=lambda x: x['final_score'])
 
-        # Build comprehensive rationale
-        rationale = f"""AI Analysis: {best['gemini_reasoning']}
+    # Build comprehensive rationale
+    rationale = f"""AI Analysis: {best['gemini_reasoning']}
 
 Classification: {best['esg_category']} (ESG-BERT confidence: {best['esg_confidence']:.0%})
 Priority Level: {best['gemini_priority']}
 AI Confidence: {best['gemini_confidence']:.0%}"""
 
-        scoring_details = {
-            'finalScore': best['final_score'],
-            'algorithmScore': best['algorithm_score'],
-            'geminiConfidence': best['gemini_confidence'],
-            'esgCategory': best['esg_category'],
-            'esgConfidence': best['esg_confidence'],
-            'priorityLevel': best['gemini_priority'],
-            'aiReasoning': best['gemini_reasoning']
-        }
+    scoring_details = {
+        'finalScore': best['final_score'],
+        'algorithmScore': best['algorithm_score'],
+        'geminiConfidence': best['gemini_confidence'],
+        'esgCategory': best['esg_category'],
+        'esgConfidence': best['esg_confidence'],
+        'priorityLevel': best['gemini_priority'],
+        'aiReasoning': best['gemini_reasoning']
+    }
 
-        return best['card'], rationale, scoring_details
+    return best['card'], rationale, scoring_details
 
 
 # Global singleton instance
 _ai_engine_instance = None
+_ai_engine_lock = threading.Lock()
 
 def get_ai_engine() -> AIDecisionEngine:
     """Get global AI engine instance (singleton pattern)"""
     global _ai_engine_instance
     if _ai_engine_instance is None:
-        _ai_engine_instance = AIDecisionEngine()
+        with _ai_engine_lock:
+            if _ai_engine_instance is None:
+                _ai_engine_instance = AIDecisionEngine()
     return _ai_engine_instance
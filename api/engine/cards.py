@@ -2,34 +2,62 @@
 Card library management utilities.
 Loads, validates, and caches decision cards from data/cards.json.
 """
-import json
+import math
 from pathlib import Path
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
 from functools import lru_cache
 
+import orjson
+
 # Get project root directory (api/engine -> api -> threadweaver)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 CARDS_PATH = PROJECT_ROOT / "data" / "cards.json"
 
+# Card schema checked by validate_cards()
+REQUIRED_CARD_FIELDS = ("id", "title", "prompt", "tags", "severity", "options")
+REQUIRED_OPTION_FIELDS = ("id", "label", "description", "deltas", "explanation")
+REQUIRED_DELTAS = ("waste", "emissions", "cost", "efficiency", "communityTrust")
+
+# Trigger keys in the order get_trigger_bounds() reports them
+TRIGGER_KEYS = (
+    "waste_min", "waste_max",
+    "emissions_min", "emissions_max",
+    "cost_min", "cost_max",
+    "efficiency_min", "efficiency_max",
+    "trust_min", "trust_max",
+)
+
+
+class _CardIndex(NamedTuple):
+    """Lookup tables built once per library load."""
+    by_id: Dict[str, Mapping]
+    by_tag: Dict[str, Tuple[int, ...]]  # tag -> positions in load_all_cards()
+    trigger_bounds: Dict[int, Tuple[float, ...]]  # id(card) -> TRIGGER_KEYS bounds
+    options: Dict[int, Dict[str, dict]]  # id(card) -> option id -> option
+    errors: Tuple[str, ...]
+
 
 @lru_cache(maxsize=1)
-def load_all_cards() -> List[dict]:
+def load_all_cards() -> Tuple[Mapping, ...]:
     """
     Load all decision cards from data/cards.json.
     Cached to avoid repeated file reads.
 
+    Cards are shared process-wide, so each one is wrapped in a read-only
+    MappingProxyType instead of being copied defensively by callers.
+
     Returns:
-        List of card dictionaries
+        Tuple of read-only card mappings
 
     Raises:
         FileNotFoundError: If cards.json doesn't exist
-        json.JSONDecodeError: If cards.json is invalid JSON
+        json.JSONDecodeError: If cards.json is invalid JSON (orjson.JSONDecodeError subclasses it)
     """
     if not CARDS_PATH.exists():
         raise FileNotFoundError(f"Cards file not found at {CARDS_PATH}")
 
-    with open(CARDS_PATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = orjson.loads(CARDS_PATH.read_bytes())
 
     # Handle both {"cards": [...]} and [...] formats
     if isinstance(data, dict) and "cards" in data:
@@ -42,10 +70,92 @@ def load_all_cards() -> List[dict]:
     if not isinstance(cards, list):
         raise ValueError("cards must be a JSON array")
 
-    return cards
+    return tuple(MappingProxyType(card) for card in cards)
+
+
+@lru_cache(maxsize=1)
+def _indexes() -> _CardIndex:
+    """
+    Index and validate the card library in a single pass.
+
+    Returns:
+        _CardIndex with id/tag/trigger lookups and schema validation errors
+    """
+    id_index = {}
+    tag_index = {}
+    trigger_bounds = {}
+    options = {}
+    errors = []
+
+    for position, card in enumerate(load_all_cards()):
+        # Keep the first card if an id is duplicated (matches a linear scan)
+        id_index.setdefault(card.get("id"), card)
+        for tag in card.get("tags", []):
+            tag_index.setdefault(tag, []).append(position)
+        # Cards are kept alive by the cached library, so id(card) is stable
+        trigger_bounds[id(card)] = _trigger_bounds(card)
+        options[id(card)] = _options_by_id(card)
+        errors.extend(_card_errors(position, card))
+
+    return _CardIndex(
+        by_id=id_index,
+        by_tag={tag: tuple(positions) for tag, positions in tag_index.items()},
+        trigger_bounds=trigger_bounds,
+        options=options,
+        errors=tuple(errors),
+    )
+
+
+def _trigger_bounds(card: Mapping) -> Tuple[float, ...]:
+    """Trigger limits in TRIGGER_KEYS order; absent limits are -inf/+inf."""
+    triggers = card.get("triggers") or {}
+    return tuple(
+        triggers[key] if triggers.get(key) is not None
+        else (-math.inf if key.endswith("_min") else math.inf)
+        for key in TRIGGER_KEYS
+    )
+
+
+def get_trigger_bounds(card: Mapping) -> Tuple[float, ...]:
+    """
+    Get a card's trigger limits as (min, max) pairs per metric.
+
+    Args:
+        card: Card mapping (library cards use the precomputed bounds)
+
+    Returns:
+        Tuple of bounds in TRIGGER_KEYS order, with -inf/+inf where unset
+    """
+    bounds = _indexes().trigger_bounds.get(id(card))
+    return bounds if bounds is not None else _trigger_bounds(card)
+
+
+def _options_by_id(card: Mapping) -> Dict[str, dict]:
+    """Option id -> option; the first option wins if an id is duplicated."""
+    by_id = {}
+    for option in card.get("options", []):
+        by_id.setdefault(option.get("id"), option)
+    return by_id
 
 
-def get_card_by_id(card_id: str) -> Optional[dict]:
+def get_option(card: Mapping, option_id: str) -> Optional[dict]:
+    """
+    Retrieve an option of a card by ID.
+
+    Args:
+        card: Card mapping (library cards use the precomputed index)
+        option_id: Option identifier
+
+    Returns:
+        Option dict or None if the card has no such option
+    """
+    options = _indexes().options.get(id(card))
+    if options is None:
+        options = _options_by_id(card)
+    return options.get(option_id)
+
+
+def get_card_by_id(card_id: str) -> Optional[Mapping]:
     """
     Retrieve a specific card by ID.
 
@@ -53,16 +163,12 @@ def get_card_by_id(card_id: str) -> Optional[dict]:
         card_id: Unique card identifier
 
     Returns:
-        Card dictionary or None if not found
+        Card mapping or None if not found
     """
-    cards = load_all_cards()
-    for card in cards:
-        if card.get("id") == card_id:
-            return card
-    return None
+    return _indexes().by_id.get(card_id)
 
 
-def get_cards_by_tags(tags: List[str]) -> List[dict]:
+def get_cards_by_tags(tags: List[str]) -> List[Mapping]:
     """
     Filter cards that have at least one matching tag.
 
@@ -70,17 +176,15 @@ def get_cards_by_tags(tags: List[str]) -> List[dict]:
         tags: List of tag strings to match
 
     Returns:
-        List of matching cards
+        List of matching cards (in library order)
     """
     cards = load_all_cards()
-    matching_cards = []
-
-    for card in cards:
-        card_tags = card.get("tags", [])
-        if any(tag in card_tags for tag in tags):
-            matching_cards.append(card)
+    tag_index = _indexes().by_tag
 
-    return matching_cards
+    # Duplicate query tags would only repeat the same union work
+    wanted = frozenset(tags)
+    positions = set().union(*(tag_index.get(tag, ()) for tag in wanted))
+    return [cards[position] for position in sorted(positions)]
 
 
 def get_cards_by_severity(severity: str) -> List[dict]:
@@ -100,43 +204,54 @@ def get_cards_by_severity(severity: str) -> List[dict]:
 def validate_cards() -> tuple[bool, List[str]]:
     """
     Validate all cards have required fields.
+    Errors are collected while the library is indexed, once per load.
 
     Returns:
         Tuple of (is_valid, list_of_errors)
     """
     try:
-        cards = load_all_cards()
+        errors = _indexes().errors
     except Exception as e:
         return False, [f"Failed to load cards: {str(e)}"]
 
+    return len(errors) == 0, list(errors)
+
+
+def _card_errors(i: int, card: Mapping) -> List[str]:
+    """
+    Check a single card against the required card/option/delta fields.
+
+    Args:
+        i: Position of the card in the library (used when it has no id)
+        card: Card mapping
+
+    Returns:
+        List of error messages (empty if the card is valid)
+    """
     errors = []
-    required_card_fields = ["id", "title", "prompt", "tags", "severity", "options"]
-    required_option_fields = ["id", "label", "description", "deltas", "explanation"]
 
-    for i, card in enumerate(cards):
-        # Check required card fields
-        for field in required_card_fields:
-            if field not in card:
-                errors.append(f"Card {i} missing required field: {field}")
+    # Check required card fields
+    for field in REQUIRED_CARD_FIELDS:
+        if field not in card:
+            errors.append(f"Card {i} missing required field: {field}")
 
-        # Check options
-        options = card.get("options", [])
-        if len(options) < 2 or len(options) > 3:
-            errors.append(f"Card {card.get('id', i)} must have 2-3 options, found {len(options)}")
+    # Check options
+    options = card.get("options", [])
+    if len(options) < 2 or len(options) > 3:
+        errors.append(f"Card {card.get('id', i)} must have 2-3 options, found {len(options)}")
 
-        for j, option in enumerate(options):
-            for field in required_option_fields:
-                if field not in option:
-                    errors.append(f"Card {card.get('id', i)}, option {j} missing field: {field}")
+    for j, option in enumerate(options):
+        for field in REQUIRED_OPTION_FIELDS:
+            if field not in option:
+                errors.append(f"Card {card.get('id', i)}, option {j} missing field: {field}")
 
-            # Check deltas
-            deltas = option.get("deltas", {})
-            required_deltas = ["waste", "emissions", "cost", "efficiency", "communityTrust"]
-            for delta_key in required_deltas:
-                if delta_key not in deltas:
-                    errors.append(f"Card {card.get('id', i)}, option {option.get('id', j)} missing delta: {delta_key}")
+        # Check deltas
+        deltas = option.get("deltas", {})
+        for delta_key in REQUIRED_DELTAS:
+            if delta_key not in deltas:
+                errors.append(f"Card {card.get('id', i)}, option {option.get('id', j)} missing delta: {delta_key}")
 
-    return len(errors) == 0, errors
+    return errors
 
 
 def get_card_count() -> int:
@@ -147,3 +262,4 @@ def get_card_count() -> int:
 def clear_cache():
     """Clear the card cache (useful for testing or hot-reload)."""
     load_all_cards.cache_clear()
+    _indexes.cache_clear()
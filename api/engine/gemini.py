@@ -3,15 +3,77 @@ Gemini AI integration for generating custom decision cards.
 Uses Google's Generative AI to create personalized sustainability scenarios.
 """
 import os
+import copy
 import json
+import asyncio
+import threading
 import google.generativeai as genai
-from typing import List, Dict, Any
+from google.generativeai import client as genai_client
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
 
 # Configure Gemini
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
 if GEMINI_API_KEY:
     genai.configure(api_key=GEMINI_API_KEY)
 
+# Base metrics in the column order used by CHALLENGE_IMPACTS
+METRIC_ORDER = ('waste', 'emissions', 'cost', 'efficiency', 'communityTrust')
+
+# Starting-metric impact of each stated challenge (higher = worse)
+CHALLENGE_IMPACTS = {
+    'High waste generation':       (15, 0, 0, 0, 0),
+    'Carbon emissions':            (0, 15, 0, 0, 0),
+    'Energy consumption':          (0, 10, 5, 0, 0),
+    'Supply chain sustainability': (0, 8, 5, 0, 0),
+    'Cost management':             (0, 0, 15, 0, 0),
+    'Regulatory compliance':       (5, 5, 0, 0, 0),
+    'Resource efficiency':         (10, 0, 0, -10, 0),
+}
+
+# Efficiency adjustment by company size
+SIZE_EFFICIENCY_BONUS = {
+    'small': -5,
+    'medium': 0,
+    'large': 5,
+    'enterprise': 10
+}
+
+# In-flight async card generations by prompt (see generate_custom_cards_async)
+_inflight_card_requests: Dict[str, "asyncio.Future[List[Dict[str, Any]]]"] = {}
+
+# Shared card-generation model (created on first use)
+_gen_model = None
+_gen_model_lock = threading.Lock()
+
+
+def _get_gen_model() -> genai.GenerativeModel:
+    """Get the shared card-generation model (thread-safe lazy singleton)."""
+    global _gen_model
+    if _gen_model is None:
+        with _gen_model_lock:
+            if _gen_model is None:
+                _gen_model = genai.GenerativeModel('gemini-2.0-flash-exp')
+    return _gen_model
+
+
+def warm_up_clients() -> None:
+    """
+    Create the shared Gemini model and SDK transport clients up front.
+
+    google-generativeai keeps one default generative client (and one async
+    client) per process and reuses its connection pool across requests, so
+    there is no per-call client to hoist. Creating them at startup moves
+    the channel setup off the first request. Call from inside the running
+    event loop (e.g. FastAPI lifespan) so the async client binds to it.
+    """
+    if not GEMINI_API_KEY:
+        return
+
+    _get_gen_model()
+    genai_client.get_default_generative_client()
+    genai_client.get_default_generative_async_client()
+
 
 def generate_custom_cards(
     company_profile: Dict[str, Any],
@@ -32,6 +94,71 @@ def generate_custom_cards(
     if not GEMINI_API_KEY:
         raise ValueError("GEMINI_API_KEY environment variable not set")
 
+    prompt = _build_cards_prompt(company_profile, number_of_cards, focus_areas)
+
+    try:
+        response = _get_gen_model().generate_content(prompt)
+        return _parse_cards(response.text)
+
+    except Exception as e:
+        print(f"Error generating cards with Gemini: {str(e)}")
+        # Return empty list on error
+        return []
+
+
+async def generate_custom_cards_async(
+    company_profile: Dict[str, Any],
+    number_of_cards: int = 10,
+    focus_areas: List[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Async variant of generate_custom_cards (awaits generate_content_async
+    instead of blocking the calling thread on the Gemini request).
+
+    Returns:
+        List of decision card dictionaries
+    """
+    if not GEMINI_API_KEY:
+        raise ValueError("GEMINI_API_KEY environment variable not set")
+
+    prompt = _build_cards_prompt(company_profile, number_of_cards, focus_areas)
+
+    # Coalesce identical concurrent requests into one Gemini call. shield()
+    # keeps a cancelled caller from cancelling the call for the others.
+    task = _inflight_card_requests.get(prompt)
+    if task is None:
+        task = asyncio.ensure_future(_request_cards_async(prompt))
+        _inflight_card_requests[prompt] = task
+        task.add_done_callback(lambda _: _inflight_card_requests.pop(prompt, None))
+
+    cards = await asyncio.shield(task)
+    # Callers share the result, so each gets its own copy (options included)
+    return copy.deepcopy(cards)
+
+
+async def _request_cards_async(prompt: str) -> List[Dict[str, Any]]:
+    """
+    Send one card-generation prompt to Gemini.
+
+    Returns:
+        List of decision card dictionaries (empty on error)
+    """
+    try:
+        response = await _get_gen_model().generate_content_async(prompt)
+        return _parse_cards(response.text)
+
+    except Exception as e:
+        print(f"Error generating cards with Gemini: {str(e)}")
+        # Return empty list on error
+        return []
+
+
+def _build_cards_prompt(
+    company_profile: Dict[str, Any],
+    number_of_cards: int,
+    focus_areas: List[str] = None
+) -> str:
+    """Build the card-generation prompt from the company profile."""
     # Build context from company profile
     company_context = f"""
 Company: {company_profile.get('companyName', 'Unknown')}
@@ -104,41 +231,41 @@ Example format:
 ]
 """
 
-    try:
-        model = genai.GenerativeModel('gemini-pro')
-        response = model.generate_content(prompt)
+    return prompt
 
-        # Extract JSON from response
-        response_text = response.text.strip()
 
-        # Remove markdown code blocks if present
-        if response_text.startswith('```json'):
-            response_text = response_text[7:]
-        if response_text.startswith('```'):
-            response_text = response_text[3:]
-        if response_text.endswith('```'):
-            response_text = response_text[:-3]
+def _parse_cards(response_text: str) -> List[Dict[str, Any]]:
+    """
+    Parse Gemini's card-generation response into card dictionaries.
 
-        response_text = response_text.strip()
+    Raises:
+        ValueError: If the response is not a JSON array
+    """
+    response_text = response_text.strip()
 
-        # Parse JSON
-        cards = json.loads(response_text)
+    # Remove markdown code blocks if present
+    if response_text.startswith('```json'):
+        response_text = response_text[7:]
+    if response_text.startswith('```'):
+        response_text = response_text[3:]
+    if response_text.endswith('```'):
+        response_text = response_text[:-3]
 
-        # Validate basic structure
-        if not isinstance(cards, list):
-            raise ValueError("Response is not a JSON array")
+    response_text = response_text.strip()
 
-        # Ensure required fields
-        for card in cards:
-            if 'options' not in card or not card['options']:
-                card['options'] = []
+    # Parse JSON
+    cards = json.loads(response_text)
 
-        return cards
+    # Validate basic structure
+    if not isinstance(cards, list):
+        raise ValueError("Response is not a JSON array")
 
-    except Exception as e:
-        print(f"Error generating cards with Gemini: {str(e)}")
-        # Return empty list on error
-        return []
+    # Ensure required fields
+    for card in cards:
+        if 'options' not in card or not card['options']:
+            card['options'] = []
+
+    return cards
 
 
 def get_size_description(size: str) -> str:
@@ -162,42 +289,34 @@ def calculate_custom_initial_metrics(
     Returns:
         Dictionary with initial metric values (0-100 scale)
     """
-    # Start with baseline
-    metrics = {
-        'waste': 50.0,
-        'emissions': 50.0,
-        'cost': 50.0,
-        'efficiency': 50.0,
-        'communityTrust': 50.0,
-    }
+    return dict(_compute_initial_metrics(_freeze_profile(company_profile)))
 
-    challenges = company_profile.get('currentChallenges', [])
-    size = company_profile.get('size', 'medium')
-
-    # Adjust based on stated challenges (higher = worse)
-    challenge_impacts = {
-        'High waste generation': {'waste': 15},
-        'Carbon emissions': {'emissions': 15},
-        'Energy consumption': {'emissions': 10, 'cost': 5},
-        'Supply chain sustainability': {'emissions': 8, 'cost': 5},
-        'Cost management': {'cost': 15},
-        'Regulatory compliance': {'emissions': 5, 'waste': 5},
-        'Resource efficiency': {'efficiency': -10, 'waste': 10},
-    }
 
-    for challenge in challenges:
-        if challenge in challenge_impacts:
-            for metric, delta in challenge_impacts[challenge].items():
-                metrics[metric] += delta
+def _freeze_profile(company_profile: Dict[str, Any]) -> Tuple:
+    """Canonical hashable key of the profile fields that affect initial metrics."""
+    return (
+        company_profile.get('size', 'medium'),
+        tuple(sorted(company_profile.get('currentChallenges') or [])),
+    )
+
+
+@lru_cache(maxsize=256)
+def _compute_initial_metrics(profile_key: Tuple) -> Dict[str, float]:
+    """
+    Compute initial metrics for a frozen profile key (see _freeze_profile).
+    Cached, so callers must copy the returned dict before handing it out.
+    """
+    size, challenges = profile_key
+
+    # Sum the selected challenge rows column-wise
+    rows = [CHALLENGE_IMPACTS[c] for c in challenges if c in CHALLENGE_IMPACTS]
+    totals = [sum(column) for column in zip(*rows)] if rows else [0] * len(METRIC_ORDER)
+
+    # Start with baseline
+    metrics = {key: 50.0 + total for key, total in zip(METRIC_ORDER, totals)}
 
     # Larger companies tend to have more established processes
-    size_efficiency_bonus = {
-        'small': -5,
-        'medium': 0,
-        'large': 5,
-        'enterprise': 10
-    }
-    metrics['efficiency'] += size_efficiency_bonus.get(size, 0)
+    metrics['efficiency'] += SIZE_EFFICIENCY_BONUS.get(size, 0)
 
     # Cap all values between 0 and 100
     for key in metrics:
@@ -2,7 +2,60 @@
 Impact Tracker - Calculate real-world sustainability impact
 Converts game metrics into tangible real-world equivalents
 """
-from typing import Dict, List
+from bisect import bisect_right
+from operator import itemgetter
+from typing import Dict, List, Tuple
+
+# Delta keys in accumulation order
+DELTA_KEYS = ('waste', 'emissions', 'cost', 'efficiency', 'communityTrust')
+_get_deltas = itemgetter(*DELTA_KEYS)
+
+# Impact grade bands: ascending cut-offs (kg saved) and the grade per band
+GRADE_THRESHOLDS = (500, 1000, 2000, 3000, 5000)
+GRADES = ('F', 'D', 'C', 'B', 'A', 'A+')
+
+# Grade-specific messaging
+GRADE_MESSAGES = {
+    'A+': ' **Outstanding Impact!** You\'re a sustainability champion!',
+    'A': ' **Excellent Work!** Your decisions are making a real difference.',
+    'B': ' **Good Progress!** You\'re on the right track.',
+    'C': ' **Solid Start!** Keep building on this foundation.',
+    'D': ' **Room for Growth** - Consider more ambitious sustainability choices.',
+    'F': ' **Early Stages** - Focus on high-impact decisions next time.'
+}
+
+# Impact report, filled from the impact dict via str.format_map
+NARRATIVE_TEMPLATE = """## Your Sustainability Impact Report
+
+{grade_msg}
+
+###  Real-World Impact
+
+Your {total_decisions} decisions have achieved:
+
+**Climate Impact:**
+-  **{co2_kg_saved:,.0f} kg CO2** prevented from entering the atmosphere
+-  Equivalent to planting **{trees_equivalent:.0f} trees** for one year
+-  Like taking a car off the road for **{cars_off_road_days:.0f} days**
+
+**Waste Reduction:**
+-  **{waste_kg_saved:,.0f} kg of waste** diverted from landfills
+-  Equivalent to **{plastic_bottles_saved:,.0f} plastic bottles** not produced
+-  Saved approximately **{water_liters_saved:,.0f} liters** of water
+
+**Economic Impact:**
+-  Cost savings: **${cost_savings_usd:,.0f}** annually
+-  Efficiency improved by **{efficiency_improvement:.0f} points**
+-  Community trust increased by **{community_trust_gain:.0f} points**
+
+###  Final Sustainability Score: {sustainability_score:.0f}/100
+
+**Overall Grade: {impact_grade}**
+
+---
+
+*Keep up the great work! Every decision compounds over time.* 
+"""
 
 
 def calculate_real_world_impact(decisions: List[Dict]) -> Dict[str, any]:
@@ -22,22 +75,15 @@ def calculate_real_world_impact(decisions: List[Dict]) -> Dict[str, any]:
     Returns:
         Dict with real-world impact metrics
     """
-    # Cumulative deltas
-    total_waste_reduction = 0
-    total_emissions_reduction = 0
-    total_cost_savings = 0
-    total_efficiency_gain = 0
-    total_trust_gain = 0
-
-    for decision in decisions:
-        # Sum up all deltas
-        if 'deltas' in decision:
-            deltas = decision['deltas']
-            total_waste_reduction += deltas.get('waste', 0)
-            total_emissions_reduction += deltas.get('emissions', 0)
-            total_cost_savings += deltas.get('cost', 0)
-            total_efficiency_gain += deltas.get('efficiency', 0)
-            total_trust_gain += deltas.get('communityTrust', 0)
+    # Cumulative deltas: one row per decision, summed column-wise
+    rows = [_delta_row(decision['deltas']) for decision in decisions if 'deltas' in decision]
+    (
+        total_waste_reduction,
+        total_emissions_reduction,
+        total_cost_savings,
+        total_efficiency_gain,
+        total_trust_gain,
+    ) = [sum(column) for column in zip(*rows)] if rows else [0] * len(DELTA_KEYS)
 
     # Convert abstract metrics to real-world equivalents
     # Scaling factors (adjust based on company size)
@@ -78,6 +124,14 @@ def calculate_real_world_impact(decisions: List[Dict]) -> Dict[str, any]:
     return impact
 
 
+def _delta_row(deltas: Dict) -> Tuple[float, ...]:
+    """Extract deltas in DELTA_KEYS order (missing keys count as 0)"""
+    try:
+        return _get_deltas(deltas)
+    except KeyError:
+        return tuple(deltas.get(key, 0) for key in DELTA_KEYS)
+
+
 def _calculate_impact_grade(co2_saved: float, waste_saved: float) -> str:
     """
     Calculate overall impact grade based on savings
@@ -91,18 +145,8 @@ def _calculate_impact_grade(co2_saved: float, waste_saved: float) -> str:
     """
     total_impact = co2_saved + waste_saved
 
-    if total_impact >= 5000:
-        return 'A+'
-    elif total_impact >= 3000:
-        return 'A'
-    elif total_impact >= 2000:
-        return 'B'
-    elif total_impact >= 1000:
-        return 'C'
-    elif total_impact >= 500:
-        return 'D'
-    else:
-        return 'F'
+    # Band index counts the cut-offs reached (>= semantics via bisect_right)
+    return GRADES[bisect_right(GRADE_THRESHOLDS, total_impact)]
 
 
 def generate_impact_narrative(impact: Dict, metrics: Dict) -> str:
@@ -116,52 +160,9 @@ def generate_impact_narrative(impact: Dict, metrics: Dict) -> str:
     Returns:
         Markdown-formatted impact story
     """
-    grade = impact['impact_grade']
-    co2_saved = impact['co2_kg_saved']
-    trees = impact['trees_equivalent']
-    waste_kg = impact['waste_kg_saved']
-    bottles = impact['plastic_bottles_saved']
-
-    # Grade-specific messaging
-    grade_messages = {
-        'A+': ' **Outstanding Impact!** You\'re a sustainability champion!',
-        'A': ' **Excellent Work!** Your decisions are making a real difference.',
-        'B': ' **Good Progress!** You\'re on the right track.',
-        'C': ' **Solid Start!** Keep building on this foundation.',
-        'D': ' **Room for Growth** - Consider more ambitious sustainability choices.',
-        'F': ' **Early Stages** - Focus on high-impact decisions next time.'
+    ctx = {
+        **impact,
+        'grade_msg': GRADE_MESSAGES.get(impact['impact_grade'], ''),
+        'sustainability_score': metrics.get('sustainabilityScore', 50),
     }
-
-    narrative = f"""## Your Sustainability Impact Report
-
-{grade_messages.get(grade, '')}
-
-###  Real-World Impact
-
-Your {impact['total_decisions']} decisions have achieved:
-
-**Climate Impact:**
--  **{co2_saved:,.0f} kg CO2** prevented from entering the atmosphere
--  Equivalent to planting **{trees:.0f} trees** for one year
--  Like taking a car off the road for **{impact['cars_off_road_days']:.0f} days**
-
-**Waste Reduction:**
--  **{waste_kg:,.0f} kg of waste** diverted from landfills
--  Equivalent to **{bottles:,.0f} plastic bottles** not produced
--  Saved approximately **{impact['water_liters_saved']:,.0f} liters** of water
-
-**Economic Impact:**
--  Cost savings: **${impact['cost_savings_usd']:,.0f}** annually
--  Efficiency improved by **{impact['efficiency_improvement']:.0f} points**
--  Community trust increased by **{impact['community_trust_gain']:.0f} points**
-
-###  Final Sustainability Score: {metrics.get('sustainabilityScore', 50):.0f}/100
-
-**Overall Grade: {grade}**
-
----
-
-*Keep up the great work! Every decision compounds over time.* 
-"""
-
-    return narrative
+    return NARRATIVE_TEMPLATE.format_map(ctx)
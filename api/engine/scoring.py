@@ -6,11 +6,21 @@ Supports both:
 - Pure algorithmic selection (fast, deterministic)
 - Hybrid AI selection (algorithm + ESG-BERT + Gemini)
 """
+import heapq
 from random import Random
-from typing import List, Optional, Tuple
-from .cards import load_all_cards
+from typing import Collection, List, Optional, Tuple
+from .cards import load_all_cards, get_trigger_bounds
 from .ai_engine import get_ai_engine
 
+# Score multiplier per card severity (harder decisions are more impactful)
+SEVERITY_WEIGHTS = {"easy": 1.0, "medium": 1.5, "hard": 2.0}
+
+# Card tag -> position in the calculate_urgency_score() tuple
+URGENCY_TAG_INDEX = {"waste": 0, "emissions": 1, "cost": 2, "efficiency": 3, "trust": 4}
+
+# Points a card tag adds at full urgency
+TAG_URGENCY_POINTS = 30
+
 
 def filter_by_triggers(metrics: dict, cards: List[dict]) -> List[dict]:
     """
@@ -26,56 +36,38 @@ def filter_by_triggers(metrics: dict, cards: List[dict]) -> List[dict]:
     Example triggers:
         {"waste_min": 60, "trust_max": 40} → Only show if waste >= 60 AND trust <= 40
     """
+    waste = metrics["waste"]
+    emissions = metrics["emissions"]
+    cost = metrics["cost"]
+    efficiency = metrics["efficiency"]
+    trust = metrics["communityTrust"]
+
     eligible_cards = []
 
     for card in cards:
-        triggers = card.get("triggers")
-
-        # No triggers = always eligible
-        if not triggers:
-            eligible_cards.append(card)
-            continue
-
-        # Check all trigger conditions
-        is_eligible = True
-
-        # Waste triggers
-        if "waste_min" in triggers and metrics["waste"] < triggers["waste_min"]:
-            is_eligible = False
-        if "waste_max" in triggers and metrics["waste"] > triggers["waste_max"]:
-            is_eligible = False
-
-        # Emissions triggers
-        if "emissions_min" in triggers and metrics["emissions"] < triggers["emissions_min"]:
-            is_eligible = False
-        if "emissions_max" in triggers and metrics["emissions"] > triggers["emissions_max"]:
-            is_eligible = False
-
-        # Cost triggers
-        if "cost_min" in triggers and metrics["cost"] < triggers["cost_min"]:
-            is_eligible = False
-        if "cost_max" in triggers and metrics["cost"] > triggers["cost_max"]:
-            is_eligible = False
-
-        # Efficiency triggers
-        if "efficiency_min" in triggers and metrics["efficiency"] < triggers["efficiency_min"]:
-            is_eligible = False
-        if "efficiency_max" in triggers and metrics["efficiency"] > triggers["efficiency_max"]:
-            is_eligible = False
-
-        # Trust triggers
-        if "trust_min" in triggers and metrics["communityTrust"] < triggers["trust_min"]:
-            is_eligible = False
-        if "trust_max" in triggers and metrics["communityTrust"] > triggers["trust_max"]:
-            is_eligible = False
-
-        if is_eligible:
+        # Precomputed at load; unset limits are -inf/+inf, so cards
+        # without triggers always pass
+        (
+            waste_min, waste_max,
+            emissions_min, emissions_max,
+            cost_min, cost_max,
+            efficiency_min, efficiency_max,
+            trust_min, trust_max,
+        ) = get_trigger_bounds(card)
+
+        if (
+            waste_min <= waste <= waste_max
+            and emissions_min <= emissions <= emissions_max
+            and cost_min <= cost <= cost_max
+            and efficiency_min <= efficiency <= efficiency_max
+            and trust_min <= trust <= trust_max
+        ):
             eligible_cards.append(card)
 
     return eligible_cards
 
 
-def calculate_urgency_score(metrics: dict) -> dict:
+def calculate_urgency_score(metrics: dict) -> Tuple[float, float, float, float, float]:
     """
     Calculate urgency scores for each metric category.
     Higher scores = more urgent problems.
@@ -84,24 +76,27 @@ def calculate_urgency_score(metrics: dict) -> dict:
         metrics: Current MetricsState
 
     Returns:
-        Dictionary of urgency scores per category
+        Tuple of (waste, emissions, cost, efficiency, trust) urgency scores,
+        indexed by URGENCY_TAG_INDEX
 
     Logic:
         - waste/emissions/cost: Higher values = more urgent
         - efficiency/trust: Lower values = more urgent
     """
-    urgency = {
-        "waste": metrics["waste"] / 100.0,  # 0-1 scale
-        "emissions": metrics["emissions"] / 100.0,
-        "cost": metrics["cost"] / 100.0,
-        "efficiency": (100 - metrics["efficiency"]) / 100.0,  # Invert (low efficiency = urgent)
-        "trust": (100 - metrics["communityTrust"]) / 100.0,  # Invert (low trust = urgent)
-    }
-
-    return urgency
+    return (
+        metrics["waste"] / 100.0,  # 0-1 scale
+        metrics["emissions"] / 100.0,
+        metrics["cost"] / 100.0,
+        (100 - metrics["efficiency"]) / 100.0,  # Invert (low efficiency = urgent)
+        (100 - metrics["communityTrust"]) / 100.0,  # Invert (low trust = urgent)
+    )
 
 
-def score_card(card: dict, metrics: dict, urgency: dict) -> Tuple[float, List[dict]]:
+def score_card(
+    card: dict,
+    metrics: dict,
+    urgency: Tuple[float, ...]
+) -> Tuple[float, float, Optional[List[Tuple[str, float]]]]:
     """
     Score a single card based on current state.
 
@@ -111,7 +106,11 @@ def score_card(card: dict, metrics: dict, urgency: dict) -> Tuple[float, List[di
         urgency: Urgency scores from calculate_urgency_score()
 
     Returns:
-        Tuple of (total_score, scoring_factors)
+        Tuple of (total_score, tag_boost, urgent_tags) where tag_boost is
+        the points added by tag matching and urgent_tags lists (tag, urgency)
+        pairs above the high-urgency threshold, or None if there are none.
+        Pass the last two to build_scoring_factors() to explain the cards
+        that are actually shown.
 
     Scoring Logic:
         1. Tag matching: Cards addressing urgent metrics score higher
@@ -122,64 +121,124 @@ def score_card(card: dict, metrics: dict, urgency: dict) -> Tuple[float, List[di
         If waste is at 80 (urgent), cards with 'waste' tag get +urgency boost
     """
     score = 10.0  # Baseline score
-    factors = []
+    urgent_tags = None  # Most cards have none; allocate on first hit
 
     # 1. Tag urgency matching
     card_tags = card.get("tags", [])
     tag_boost = 0.0
 
     for tag in card_tags:
-        if tag in urgency:
-            tag_urgency = urgency[tag]
-            tag_boost += tag_urgency * 30  # Max +30 points per urgent tag
+        idx = URGENCY_TAG_INDEX.get(tag)
+        if idx is not None:
+            tag_urgency = urgency[idx]
+            tag_boost += tag_urgency * TAG_URGENCY_POINTS
 
             if tag_urgency > 0.6:  # High urgency threshold
-                factors.append({
-                    "factor": f"High {tag} urgency",
-                    "score": tag_urgency * 30,
-                    "reason": f"{tag.capitalize()} is at {metrics.get(tag, 0):.0f}, requiring attention"
-                })
+                if urgent_tags is None:
+                    urgent_tags = []
+                urgent_tags.append((tag, tag_urgency))
 
     score += tag_boost
 
     # 2. Severity weighting
-    severity = card.get("severity", "medium")
-    severity_weights = {"easy": 1.0, "medium": 1.5, "hard": 2.0}
-    severity_multiplier = severity_weights.get(severity, 1.0)
-    score *= severity_multiplier
+    score *= SEVERITY_WEIGHTS.get(card.get("severity", "medium"), 1.0)
+
+    # 3. Balance score (encourage addressing underperforming metrics)
+    if metrics.get("sustainabilityScore", 50) < 40:
+        score += 15
+
+    return score, tag_boost, urgent_tags
+
+
+def build_scoring_factors(
+    card: dict,
+    metrics: dict,
+    tag_boost: float,
+    urgent_tags: Optional[List[Tuple[str, float]]]
+) -> List[dict]:
+    """
+    Build the human-readable scoring factors for a scored card.
+
+    Only called for the top candidates, so the formatting cost is not paid
+    for every eligible card.
+
+    Args:
+        card: Card dictionary
+        metrics: Current MetricsState
+        tag_boost: Tag-matching points returned by score_card()
+        urgent_tags: Urgent (tag, urgency) pairs returned by score_card(), or None
 
+    Returns:
+        List of {factor, score, reason} dicts
+    """
+    factors = [
+        {
+            "factor": f"High {tag} urgency",
+            "score": tag_urgency * TAG_URGENCY_POINTS,
+            "reason": f"{tag.capitalize()} is at {metrics.get(tag, 0):.0f}, requiring attention"
+        }
+        for tag, tag_urgency in urgent_tags or ()
+    ]
+
+    severity = card.get("severity", "medium")
     if severity == "hard":
+        severity_multiplier = SEVERITY_WEIGHTS[severity]
         factors.append({
             "factor": "High-impact decision",
-            "score": (severity_multiplier - 1) * score,
+            "score": (severity_multiplier - 1) * ((10.0 + tag_boost) * severity_multiplier),
             "reason": f"This is a {severity} decision with significant long-term effects"
         })
 
-    # 3. Balance score (encourage addressing underperforming metrics)
     sustainability_score = metrics.get("sustainabilityScore", 50)
     if sustainability_score < 40:
-        score += 15
         factors.append({
             "factor": "Low sustainability score",
             "score": 15,
             "reason": f"Overall sustainability at {sustainability_score:.0f} needs improvement"
         })
 
-    return score, factors
+    return factors
+
+
+def _weighted_pick(rng: Random, candidates: List[dict]) -> dict:
+    """
+    Pick one scored candidate with probability proportional to its score.
+
+    Inverse-CDF with a linear scan, which beats rng.choices for the handful
+    of candidates we pick from. Cumulative sums and the r < cumulative test
+    mirror rng.choices(k=1), so seeded picks are unchanged.
+
+    Args:
+        rng: Random instance to draw from
+        candidates: Non-empty list of {"card", "score", ...} dicts
+
+    Returns:
+        The selected candidate
+    """
+    r = rng.random() * sum(c["score"] for c in candidates)
+    cumulative = 0.0
+    for candidate in candidates[:-1]:
+        cumulative += candidate["score"]
+        if r < cumulative:
+            return candidate
+    return candidates[-1]
 
 
 def select_card(
     metrics: dict,
-    used_card_ids: List[str],
-    seed: Optional[int] = None
+    used_card_ids: Collection[str],
+    seed: Optional[int] = None,
+    rng: Optional[Random] = None
 ) -> Tuple[Optional[dict], str, dict]:
     """
     Select the next decision card using AI scoring algorithm.
 
     Args:
         metrics: Current MetricsState as dict
-        used_card_ids: List of card IDs already used in this session
+        used_card_ids: Card IDs already used in this session
         seed: Optional random seed for deterministic selection
+        rng: Optional Random instance to draw from (e.g. one shared across a
+            simulation run); takes precedence over seed
 
     Returns:
         Tuple of (selected_card, rationale, scoring_details)
@@ -193,13 +252,15 @@ def select_card(
         6. Return top card with explanation
     """
     # Create local Random instance for thread-safe randomness
-    rng = Random(seed) if seed is not None else Random()
+    if rng is None:
+        rng = Random(seed) if seed is not None else Random()
 
     # 1. Load all cards
     all_cards = load_all_cards()
 
-    # 2. Filter out used cards
-    available_cards = [card for card in all_cards if card["id"] not in used_card_ids]
+    # 2. Filter out used cards (set membership; callers may pass a list)
+    used_set = used_card_ids if isinstance(used_card_ids, (set, frozenset)) else set(used_card_ids)
+    available_cards = [card for card in all_cards if card["id"] not in used_set]
 
     # Fallback: If all cards used, allow reuse (important for long timelines/autopilot)
     if not available_cards:
@@ -219,22 +280,24 @@ def select_card(
     scored_cards = []
 
     for card in eligible_cards:
-        score, factors = score_card(card, metrics, urgency)
+        score, tag_boost, urgent_tags = score_card(card, metrics, urgency)
         scored_cards.append({
             "card": card,
             "score": score,
-            "factors": factors
+            "tag_boost": tag_boost,
+            "urgent_tags": urgent_tags
         })
 
-    # 5. Sort by score (descending)
-    scored_cards.sort(key=lambda x: x["score"], reverse=True)
-
-    # 6. Add weighted randomness to top 3 candidates
-    top_candidates = scored_cards[:min(3, len(scored_cards))]
+    # 5-6. Take the top 3 by score (partial selection, no full sort)
+    # and add weighted randomness between them
+    top_candidates = heapq.nlargest(3, scored_cards, key=lambda x: x["score"])
+    for candidate in top_candidates:
+        candidate["factors"] = build_scoring_factors(
+            candidate["card"], metrics, candidate.pop("tag_boost"), candidate.pop("urgent_tags")
+        )
 
     # Weighted random selection (higher scores = higher probability)
-    weights = [c["score"] for c in top_candidates]
-    selected = rng.choices(top_candidates, weights=weights, k=1)[0]
+    selected = _weighted_pick(rng, top_candidates)
 
     # Build rationale
     top_factors = selected["factors"][:3]  # Top 3 reasons
@@ -257,7 +320,7 @@ def select_card(
 
 def select_card_with_ai(
     metrics: dict,
-    used_card_ids: List[str],
+    used_card_ids: Collection[str],
     seed: Optional[int] = None,
     use_ai: bool = True
 ) -> Tuple[Optional[dict], str, dict]:
@@ -288,7 +351,8 @@ def select_card_with_ai(
 
     # 1. Load and filter cards (same as algorithm)
     all_cards = load_all_cards()
-    available_cards = [card for card in all_cards if card["id"] not in used_card_ids]
+    used_set = used_card_ids if isinstance(used_card_ids, (set, frozenset)) else set(used_card_ids)
+    available_cards = [card for card in all_cards if card["id"] not in used_set]
 
     if not available_cards:
         print(f"All {len(all_cards)} cards used. Allowing reuse.")
@@ -306,18 +370,20 @@ def select_card_with_ai(
     scored_cards = []
 
     for card in eligible_cards:
-        score, factors = score_card(card, metrics, urgency)
+        score, tag_boost, urgent_tags = score_card(card, metrics, urgency)
         scored_cards.append({
             "card": card,
             "score": score,
-            "factors": factors
+            "tag_boost": tag_boost,
+            "urgent_tags": urgent_tags
         })
 
-    # Sort by score
-    scored_cards.sort(key=lambda x: x["score"], reverse=True)
-
-    # 4. Get top 3 candidates for AI analysis
-    top_candidates = scored_cards[:min(3, len(scored_cards))]
+    # 4. Get top 3 candidates for AI analysis (partial selection, no full sort)
+    top_candidates = heapq.nlargest(3, scored_cards, key=lambda x: x["score"])
+    for candidate in top_candidates:
+        candidate["factors"] = build_scoring_factors(
+            candidate["card"], metrics, candidate.pop("tag_boost"), candidate.pop("urgent_tags")
+        )
 
     # 5. AI ENHANCEMENT - Use multi-model pipeline
     try:
@@ -341,8 +407,7 @@ def select_card_with_ai(
     except Exception as e:
         # Fallback to algorithm if AI fails
         print(f"AI enhancement failed, falling back to algorithm: {e}")
-        weights = [c["score"] for c in top_candidates]
-        selected = rng.choices(top_candidates, weights=weights, k=1)[0]
+        selected = _weighted_pick(rng, top_candidates)
 
         top_factors = selected["factors"][:3]
         rationale = "This card was chosen because: " + "; ".join(
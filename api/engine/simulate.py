@@ -2,8 +2,9 @@
 Autopilot simulation engine.
 Automatically selects best options and simulates full timeline runs.
 """
-from typing import List, Optional, Tuple
-from copy import deepcopy
+from random import Random
+from typing import Collection, List, Optional, Tuple
+from .cards import get_option
 from .scoring import select_card
 
 
@@ -52,17 +53,39 @@ def apply_deltas(metrics: dict, deltas: dict) -> dict:
     Returns:
         New MetricsState with updated values (clamped to 0-100)
     """
-    new_metrics = deepcopy(metrics)
+    # Metrics are a flat schema, so compute the new state in locals with
+    # clamp() and calculate_sustainability_score() inlined (this runs for
+    # every option evaluated and every simulated step)
+    get = deltas.get
+    waste = metrics["waste"] + get("waste", 0.0)
+    emissions = metrics["emissions"] + get("emissions", 0.0)
+    cost = metrics["cost"] + get("cost", 0.0)
+    efficiency = metrics["efficiency"] + get("efficiency", 0.0)
+    trust = metrics["communityTrust"] + get("communityTrust", 0.0)
+
+    waste = 0.0 if waste < 0.0 else (100.0 if waste > 100.0 else waste)
+    emissions = 0.0 if emissions < 0.0 else (100.0 if emissions > 100.0 else emissions)
+    cost = 0.0 if cost < 0.0 else (100.0 if cost > 100.0 else cost)
+    efficiency = 0.0 if efficiency < 0.0 else (100.0 if efficiency > 100.0 else efficiency)
+    trust = 0.0 if trust < 0.0 else (100.0 if trust > 100.0 else trust)
 
-    # Apply deltas to base metrics
-    for key in ["waste", "emissions", "cost", "efficiency", "communityTrust"]:
-        if key in deltas:
-            new_metrics[key] = clamp(new_metrics[key] + deltas[key])
-
-    # Recalculate sustainability score
-    new_metrics["sustainabilityScore"] = calculate_sustainability_score(new_metrics)
+    score = (
+        (100 - waste) * 0.25 +
+        (100 - emissions) * 0.25 +
+        (100 - cost) * 0.15 +
+        efficiency * 0.20 +
+        trust * 0.15
+    )
+    score = 0 if score < 0 else (100 if score > 100 else score)
 
-    return new_metrics
+    return {
+        "waste": waste,
+        "emissions": emissions,
+        "cost": cost,
+        "efficiency": efficiency,
+        "communityTrust": trust,
+        "sustainabilityScore": score,
+    }
 
 
 def evaluate_option(option: dict, metrics: dict) -> Tuple[float, str]:
@@ -82,7 +105,24 @@ def evaluate_option(option: dict, metrics: dict) -> Tuple[float, str]:
     Returns:
         Tuple of (objective_score, explanation)
     """
-    deltas = option["deltas"]
+    objective_score, score_gain, _ = _option_objective(option["deltas"], metrics)
+    return objective_score, _explain_option(option, score_gain)
+
+
+def _option_objective(deltas: dict, metrics: dict) -> Tuple[float, float, dict]:
+    """
+    Compute the autopilot objective for a set of deltas (no explanation).
+
+    Args:
+        deltas: Option metric changes
+        metrics: Current MetricsState
+
+    Returns:
+        Tuple of (objective_score, sustainability_score_gain, projected_metrics)
+    """
+    get = deltas.get
+    d_cost = get("cost", 0)
+    d_trust = get("communityTrust", 0)
 
     # Simulate applying this option
     projected_metrics = apply_deltas(metrics, deltas)
@@ -91,14 +131,14 @@ def evaluate_option(option: dict, metrics: dict) -> Tuple[float, str]:
     score_gain = projected_metrics["sustainabilityScore"] - metrics["sustainabilityScore"]
 
     cost_penalty = 0
-    if deltas.get("cost", 0) > 10:  # Penalize large cost increases
-        cost_penalty = deltas["cost"] * -2
+    if d_cost > 10:  # Penalize large cost increases
+        cost_penalty = d_cost * -2
 
     trust_penalty = 0
-    if deltas.get("communityTrust", 0) < -5:  # Penalize trust drops
-        trust_penalty = deltas["communityTrust"] * 3
+    if d_trust < -5:  # Penalize trust drops
+        trust_penalty = d_trust * 3
 
-    efficiency_bonus = deltas.get("efficiency", 0) * 1.5  # Reward efficiency
+    efficiency_bonus = get("efficiency", 0) * 1.5  # Reward efficiency
 
     # Weighted objective
     objective_score = (
@@ -108,25 +148,42 @@ def evaluate_option(option: dict, metrics: dict) -> Tuple[float, str]:
         efficiency_bonus
     )
 
-    # Build explanation
+    return objective_score, score_gain, projected_metrics
+
+
+def _explain_option(option: dict, score_gain: float) -> str:
+    """
+    Build the autopilot explanation for a chosen option.
+
+    Args:
+        option: Decision option with deltas
+        score_gain: Sustainability score change from _option_objective()
+
+    Returns:
+        Explanation string
+    """
+    get = option["deltas"].get
+    d_waste = get("waste", 0)
+    d_emissions = get("emissions", 0)
+    d_efficiency = get("efficiency", 0)
+    d_trust = get("communityTrust", 0)
+
     reasons = []
     if score_gain > 0:
         reasons.append(f"+{score_gain:.1f} sustainability score")
-    if deltas.get("waste", 0) < 0:
-        reasons.append(f"{deltas['waste']:.0f} waste reduction")
-    if deltas.get("emissions", 0) < 0:
-        reasons.append(f"{deltas['emissions']:.0f} emissions reduction")
-    if deltas.get("efficiency", 0) > 0:
-        reasons.append(f"+{deltas['efficiency']:.0f} efficiency gain")
-    if deltas.get("communityTrust", 0) > 0:
-        reasons.append(f"+{deltas['communityTrust']:.0f} community trust")
+    if d_waste < 0:
+        reasons.append(f"{d_waste:.0f} waste reduction")
+    if d_emissions < 0:
+        reasons.append(f"{d_emissions:.0f} emissions reduction")
+    if d_efficiency > 0:
+        reasons.append(f"+{d_efficiency:.0f} efficiency gain")
+    if d_trust > 0:
+        reasons.append(f"+{d_trust:.0f} community trust")
 
-    explanation = f"Selected '{option['label']}': {', '.join(reasons)}"
+    return f"Selected '{option['label']}': {', '.join(reasons)}"
 
-    return objective_score, explanation
 
-
-def select_best_option(card: dict, metrics: dict) -> Tuple[dict, str]:
+def select_best_option(card: dict, metrics: dict) -> Tuple[dict, str, dict]:
     """
     Automatically select the best option from a decision card.
 
@@ -135,25 +192,19 @@ def select_best_option(card: dict, metrics: dict) -> Tuple[dict, str]:
         metrics: Current MetricsState
 
     Returns:
-        Tuple of (best_option, explanation)
+        Tuple of (best_option, explanation, projected_metrics), where
+        projected_metrics is the state after applying the best option
     """
     options = card["options"]
 
-    # Evaluate each option
-    evaluated = []
-    for option in options:
-        score, explanation = evaluate_option(option, metrics)
-        evaluated.append({
-            "option": option,
-            "score": score,
-            "explanation": explanation
-        })
-
-    # Sort by objective score (descending)
-    evaluated.sort(key=lambda x: x["score"], reverse=True)
+    # Score every option, but only explain the winner. max() keeps the
+    # first of equal scores, same as the previous stable descending sort.
+    evaluated = [_option_objective(option["deltas"], metrics) for option in options]
+    best_index = max(range(len(options)), key=lambda i: evaluated[i][0])
 
-    best = evaluated[0]
-    return best["option"], best["explanation"]
+    best_option = options[best_index]
+    _, score_gain, projected_metrics = evaluated[best_index]
+    return best_option, _explain_option(best_option, score_gain), projected_metrics
 
 
 def simulate_step(
@@ -175,16 +226,16 @@ def simulate_step(
     # Find the option
     if chosen_option_id:
         # User-specified option
-        option = next((opt for opt in card["options"] if opt["id"] == chosen_option_id), None)
+        option = get_option(card, chosen_option_id)
         if not option:
             raise ValueError(f"Option {chosen_option_id} not found in card {card['id']}")
         explanation = option["explanation"]
-    else:
-        # Autopilot: select best option
-        option, explanation = select_best_option(card, current_metrics)
 
-    # Apply deltas
-    new_metrics = apply_deltas(current_metrics, option["deltas"])
+        # Apply deltas
+        new_metrics = apply_deltas(current_metrics, option["deltas"])
+    else:
+        # Autopilot: select best option (already applied during evaluation)
+        option, explanation, new_metrics = select_best_option(card, current_metrics)
 
     return new_metrics, explanation
 
@@ -193,7 +244,7 @@ def simulate_full_run(
     initial_metrics: dict,
     steps: int,
     start_step: int = 1,
-    used_card_ids: Optional[List[str]] = None,
+    used_card_ids: Optional[Collection[str]] = None,
     seed: Optional[int] = None
 ) -> List[dict]:
     """
@@ -210,27 +261,26 @@ def simulate_full_run(
         List of timeline nodes (each with step, cardId, chosenOptionId, metricsAfter, explanation)
     """
     nodes = []
-    current_metrics = deepcopy(initial_metrics)
-    used_card_ids = used_card_ids.copy() if used_card_ids else []
+    # apply_deltas always returns a fresh dict, so the caller's metrics are
+    # never mutated and need no defensive copy
+    current_metrics = initial_metrics
+    # Set for O(1) membership checks in select_card
+    used_card_ids = set(used_card_ids) if used_card_ids else set()
+    # One generator for the whole run; successive draws vary per step
+    rng = Random(seed) if seed else Random()
 
     for i in range(steps):
         step = start_step + i
         # Select next card
-        card, rationale, scoring_details = select_card(
-            current_metrics,
-            used_card_ids,
-            seed=seed + step if seed else None  # Vary seed per step
-        )
+        card, rationale, scoring_details = select_card(current_metrics, used_card_ids, rng=rng)
 
         if not card:
             # No more eligible cards
             break
 
-        # Autopilot: select best option
-        best_option, explanation = select_best_option(card, current_metrics)
-
-        # Apply decision
-        new_metrics = apply_deltas(current_metrics, best_option["deltas"])
+        # Autopilot: select best option; its projected metrics are the
+        # new state, so the deltas don't need to be applied again
+        best_option, explanation, new_metrics = select_best_option(card, current_metrics)
 
         # Create node
         node = {
@@ -245,6 +295,6 @@ def simulate_full_run(
 
         # Update state for next iteration
         current_metrics = new_metrics
-        used_card_ids.append(card["id"])
+        used_card_ids.add(card["id"])
 
     return nodes
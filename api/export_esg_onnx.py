@@ -0,0 +1,52 @@
+"""
+Export ESG-BERT to a dynamically quantized int8 ONNX model.
+Writes api/engine/onnx/esg-bert-int8.onnx plus tokenizer and config files,
+which AIDecisionEngine picks up automatically when onnxruntime is installed.
+
+Requires: pip install "optimum[onnxruntime]"
+Run with: python export_esg_onnx.py
+"""
+import shutil
+import tempfile
+from pathlib import Path
+
+from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+from optimum.onnxruntime.configuration import AutoQuantizationConfig
+from transformers import AutoTokenizer
+
+MODEL_ID = "nbroad/ESG-BERT"
+OUTPUT_DIR = Path(__file__).parent / "engine" / "onnx"
+OUTPUT_MODEL = OUTPUT_DIR / "esg-bert-int8.onnx"
+
+
+def main():
+    """Export FP32 ONNX, quantize weights to int8, and save alongside the tokenizer."""
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+
+        # 1. Export FP32 ONNX graph
+        print(f"Exporting {MODEL_ID} to ONNX...")
+        model = ORTModelForSequenceClassification.from_pretrained(MODEL_ID, export=True)
+        model.save_pretrained(tmp_dir)
+
+        # 2. Dynamic int8 quantization (VNNI kernels on AVX512 CPUs)
+        print("Quantizing to int8...")
+        quantizer = ORTQuantizer.from_pretrained(tmp_dir)
+        quantizer.quantize(
+            save_dir=tmp_dir / "quantized",
+            quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False),
+        )
+
+        shutil.copy(tmp_dir / "quantized" / "model_quantized.onnx", OUTPUT_MODEL)
+
+    # 3. Tokenizer + config (id2label) next to the model
+    AutoTokenizer.from_pretrained(MODEL_ID).save_pretrained(OUTPUT_DIR)
+    model.config.save_pretrained(OUTPUT_DIR)
+
+    print(f"Saved quantized model to {OUTPUT_MODEL}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,20 @@
 FastAPI backend for Threadweaver: Sustainable Futures.
 Provides AI-driven decision generation and autopilot simulation.
 """
-from typing import List
+import asyncio
+import os
+import re
+from functools import lru_cache
+from typing import BinaryIO, Collection, FrozenSet, List, NamedTuple, Optional, Tuple
 from fastapi import FastAPI, HTTPException, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import ValidationError
 from contextlib import asynccontextmanager
+import anyio
 import fitz  # PyMuPDF
+import orjson
 
 from schemas.models import (
     GenerateDecisionRequest,
@@ -15,14 +24,30 @@ from schemas.models import (
     ApplyDecisionResponse,
     SimulateAutopilotRequest,
     SimulateAutopilotResponse,
-    TimelineNodeResponse,
     HealthResponse,
     DecisionCard,
+    DecisionOption,
+    DecisionTriggers,
     MetricsState,
     GenerateCustomCardsRequest,
     GenerateCustomCardsResponse,
+    SubRequest,
+    SubResponse,
+    BatchRequest,
+    BatchResponse,
 )
-from engine import cards, scoring, simulate, gemini, impact_tracker
+from engine import cards, scoring, simulate, gemini, impact_tracker, ai_engine
+
+
+# Worker threads available to sync (def) route handlers
+THREADPOOL_SIZE = 64
+
+# Upload limits for PDF extraction
+MAX_PDF_BYTES = 20 * 1024 * 1024
+
+# Extracted PDF text is truncated to this many characters (for AI processing)
+PDF_TEXT_MAX_CHARS = 5000
+_WHITESPACE_RE = re.compile(r"\s+")
 
 
 # Lifespan context manager for startup/shutdown
@@ -38,10 +63,27 @@ async def lifespan(app: FastAPI):
     else:
         print(f"SUCCESS: Loaded {cards.get_card_count()} decision cards successfully")
 
+        # Build every card's response model now rather than on first request
+        for card in cards.load_all_cards():
+            _card_model(card["id"])
+        _health_body()
+
+    # Sync handlers run in AnyIO's worker threads; raise the default (40) cap
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
+    # Create the AI engine now so ESG-BERT warms up before the first request
+    ai_engine.get_ai_engine()
+
+    # Open the shared Gemini connections before the first request
+    gemini.warm_up_clients()
+
     yield  # App runs here
 
     # Shutdown: Clear cache
     cards.clear_cache()
+    _card_model.cache_clear()
+    _health_body.cache_clear()
+    _cached_decision.cache_clear()
     print("CLEANUP: Cache cleared")
 
 
@@ -51,16 +93,36 @@ app = FastAPI(
     description="AI-driven sustainability simulation engine",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson serializes much faster than stdlib json
 )
 
 
+# Dev origins allowed on any port (equivalent to ^http://(localhost|127\.0\.0\.1)(:\d+)?$)
+LOCAL_DEV_ORIGINS = ("http://localhost", "http://127.0.0.1")
+
+
+class LocalDevCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that matches local dev origins with string checks instead of a regex."""
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        if self.allow_all_origins or origin in self.allow_origins:
+            return True
+
+        for prefix in LOCAL_DEV_ORIGINS:
+            if origin.startswith(prefix):
+                port = origin[len(prefix):]
+                # Bare host, or ":" followed by at least one digit
+                return not port or (port[0] == ":" and port[1:].isdecimal())
+
+        return False
+
+
 # CORS configuration: allow localhost and 127.0.0.1 on any port (dev) + production
 app.add_middleware(
-    CORSMiddleware,
+    LocalDevCORSMiddleware,
     allow_origins=[
         "https://threadweaver.vercel.app",
     ],
-    allow_origin_regex=r"^http://(localhost|127\.0\.0\.1)(:\d+)?$",
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -68,22 +130,45 @@ app.add_middleware(
 )
 
 
+def metrics_to_dict(m: MetricsState) -> dict:
+    """
+    Convert MetricsState to the plain dict the engine expects.
+
+    Pydantic v2 stores field values in the instance __dict__ under their
+    field names (which equal the aliases here), so a shallow copy of it is
+    the same as model_dump(by_alias=True) without the serializer walk.
+
+    Args:
+        m: Validated metrics model
+
+    Returns:
+        Metrics dictionary
+    """
+    return m.__dict__.copy()
+
+
 # ==================== Health Check ====================
 
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
-    """Health check endpoint for monitoring."""
-    return HealthResponse(
+    """Health check endpoint for monitoring (serves cached, pre-serialized bytes)."""
+    return Response(content=_health_body(), media_type="application/json")
+
+
+@lru_cache(maxsize=1)
+def _health_body() -> bytes:
+    """Serialize the health response once; it never changes while the app runs."""
+    return orjson.dumps(HealthResponse(
         status="healthy",
         version="1.0.0",
         cardsLoaded=cards.get_card_count()
-    )
+    ).model_dump())
 
 
 # ==================== Decision Generation ====================
 
 @app.post("/api/generate-decision", response_model=GenerateDecisionResponse)
-async def generate_decision(request: GenerateDecisionRequest):
+def generate_decision(request: GenerateDecisionRequest):
     """
     Generate next decision card based on current state.
 
@@ -102,16 +187,21 @@ async def generate_decision(request: GenerateDecisionRequest):
         HTTPException: If no eligible cards found
     """
     # Convert Pydantic models to dicts for engine
-    metrics_dict = request.currentMetrics.model_dump(by_alias=True)
+    metrics_dict = metrics_to_dict(request.currentMetrics)
 
     # Select card using HYBRID AI SYSTEM (algorithm + ESG-BERT + Gemini)
-    # Set use_ai=True to enable multi-model AI enhancement
-    card_dict, rationale, scoring_details = scoring.select_card_with_ai(
-        metrics=metrics_dict,
-        used_card_ids=request.usedCardIds,
-        seed=request.seed,
-        use_ai=True  # Enable AI enhancement
-    )
+    # Seeded selection without Gemini is a pure function of its inputs, so
+    # repeated states are served from a process-level cache
+    if request.seed is not None and not ai_engine.GEMINI_API_KEY:
+        card_dict, rationale, scoring_details = _cached_decision(
+            tuple(metrics_dict.items()),
+            frozenset(request.usedCardIds),
+            request.seed,
+        )
+    else:
+        card_dict, rationale, scoring_details = _select_decision(
+            metrics_dict, request.usedCardIds, request.seed
+        )
 
     if not card_dict:
         raise HTTPException(
@@ -119,8 +209,8 @@ async def generate_decision(request: GenerateDecisionRequest):
             detail="No eligible cards available. All cards may have been used or no cards match current triggers."
         )
 
-    # Convert to Pydantic model
-    card = DecisionCard(**card_dict)
+    # Convert to Pydantic model (cards are validated at startup)
+    card = _card_model(card_dict["id"])
 
     return GenerateDecisionResponse(
         card=card,
@@ -129,9 +219,124 @@ async def generate_decision(request: GenerateDecisionRequest):
     )
 
 
+def _select_decision(
+    metrics: dict,
+    used_card_ids: Collection[str],
+    seed: Optional[int]
+) -> Tuple[Optional[dict], str, dict]:
+    """Run the hybrid selector with AI enhancement enabled."""
+    return scoring.select_card_with_ai(
+        metrics=metrics,
+        used_card_ids=used_card_ids,
+        seed=seed,
+        use_ai=True  # Enable AI enhancement
+    )
+
+
+@lru_cache(maxsize=4096)
+def _cached_decision(
+    metrics_items: Tuple[Tuple[str, float], ...],
+    used_card_ids: FrozenSet[str],
+    seed: int
+) -> Tuple[Optional[dict], str, dict]:
+    """
+    Memoized _select_decision for deterministic requests (cached).
+
+    Only valid when the result cannot vary between calls: a seed is given
+    (the algorithmic fallback draws from Random(seed)) and Gemini is not
+    configured (LLM scores are not reproducible). Metrics are keyed
+    exactly, since triggers and urgency scoring use raw values.
+
+    Args:
+        metrics_items: Metrics as a tuple of (key, value) pairs
+        used_card_ids: Card ids already used
+        seed: Random seed
+
+    Returns:
+        Tuple of (selected_card, rationale, scoring_details)
+    """
+    return _select_decision(dict(metrics_items), used_card_ids, seed)
+
+
 # ==================== Apply Decision ====================
 
-def generate_business_state_narrative(card: dict, option: dict, new_metrics: dict) -> str:
+class NarrativeMetrics(NamedTuple):
+    """Metrics read by the business narrative, in _METRIC_NARRATIVES order."""
+    waste: float
+    emissions: float
+    cost: float
+    efficiency: float
+    trust: float
+    score: float
+
+    @classmethod
+    def from_dict(cls, metrics: dict) -> "NarrativeMetrics":
+        """Build from a MetricsState-shaped dict."""
+        return cls(
+            metrics["waste"],
+            metrics["emissions"],
+            metrics["cost"],
+            metrics["efficiency"],
+            metrics["communityTrust"],
+            metrics["sustainabilityScore"],
+        )
+
+
+# Overall assessment by sustainability score, indexed by _score_bucket()
+_SCORE_NARRATIVES = (
+    "The dining operation faces significant sustainability challenges that require strategic attention.",
+    "Sustainability efforts are underway, though challenges remain in balancing environmental and operational goals.",
+    "The dining operation is making solid progress on sustainability, with measurable improvements across key areas.",
+    "Your campus dining operation is now a sustainability leader, setting the standard for institutional food service.",
+)
+
+# Per-metric state narratives as (metric_key, (low_text, mid_text, high_text)),
+# indexed by _metric_bucket() and in output order. None means no sentence.
+_METRIC_NARRATIVES = (
+    # Waste management state
+    ("waste", (
+        "Food waste has been dramatically reduced through smart sourcing and composting programs.",
+        None,
+        "Food waste remains a persistent challenge, with significant amounts going to landfills daily.",
+    )),
+    # Emissions state
+    ("emissions", (
+        "Carbon emissions have dropped thanks to local sourcing and energy-efficient equipment.",
+        None,
+        "The carbon footprint remains high, driven by energy-intensive operations and supply chain choices.",
+    )),
+    # Financial state
+    ("cost", (
+        "Cost controls are working well, freeing up budget for further sustainability investments.",
+        None,
+        "Operating costs have risen, putting pressure on the budget and limiting future initiatives.",
+    )),
+    # Operational state
+    ("efficiency", (
+        "Operational inefficiencies are creating bottlenecks and staff frustration.",
+        None,
+        "Operations run smoothly with optimized processes and well-trained staff.",
+    )),
+    # Stakeholder relations
+    ("communityTrust", (
+        "Stakeholder trust is low, with concerns about transparency and commitment to change.",
+        None,
+        "Student satisfaction is high, with strong community support for sustainability initiatives.",
+    )),
+)
+
+
+def _score_bucket(score: float) -> int:
+    """Bucket a sustainability score: 0 (<30), 1 (30-50), 2 (50-70), 3 (>=70)."""
+    return 3 if score >= 70 else (2 if score >= 50 else (1 if score >= 30 else 0))
+
+
+def _metric_bucket(value: float) -> int:
+    """Bucket a base metric: 0 (<=30), 1 (between), 2 (>=70)."""
+    return 0 if value <= 30 else (2 if value >= 70 else 1)
+
+
+def generate_business_state_narrative(card: dict, option: dict, new_metrics: NarrativeMetrics) -> str:
     """
     Generate a narrative describing the business state after a decision.
 
@@ -143,66 +348,46 @@ def generate_business_state_narrative(card: dict, option: dict, new_metrics: dic
     Returns:
         A narrative string describing the current business state
     """
-    # Extract key metrics
-    waste = new_metrics["waste"]
-    emissions = new_metrics["emissions"]
-    cost = new_metrics["cost"]
-    efficiency = new_metrics["efficiency"]
-    trust = new_metrics["communityTrust"]
-    score = new_metrics["sustainabilityScore"]
-
-    # Determine business state based on metrics and decision context
-    narratives = []
-
-    # Overall assessment based on sustainability score
-    if score >= 70:
-        narratives.append("Your campus dining operation is now a sustainability leader, setting the standard for institutional food service.")
-    elif score >= 50:
-        narratives.append("The dining operation is making solid progress on sustainability, with measurable improvements across key areas.")
-    elif score >= 30:
-        narratives.append("Sustainability efforts are underway, though challenges remain in balancing environmental and operational goals.")
-    else:
-        narratives.append("The dining operation faces significant sustainability challenges that require strategic attention.")
+    # Quantize metrics to the exact threshold buckets the text depends on
+    metric_buckets = (
+        _metric_bucket(new_metrics.waste),
+        _metric_bucket(new_metrics.emissions),
+        _metric_bucket(new_metrics.cost),
+        _metric_bucket(new_metrics.efficiency),
+        _metric_bucket(new_metrics.trust),
+    )
 
-    # Waste management state
-    if waste <= 30:
-        narratives.append("Food waste has been dramatically reduced through smart sourcing and composting programs.")
-    elif waste >= 70:
-        narratives.append("Food waste remains a persistent challenge, with significant amounts going to landfills daily.")
+    return _compose_narrative(_score_bucket(new_metrics.score), metric_buckets, option["label"])
 
-    # Emissions state
-    if emissions <= 30:
-        narratives.append("Carbon emissions have dropped thanks to local sourcing and energy-efficient equipment.")
-    elif emissions >= 70:
-        narratives.append("The carbon footprint remains high, driven by energy-intensive operations and supply chain choices.")
-
-    # Financial state
-    if cost <= 30:
-        narratives.append("Cost controls are working well, freeing up budget for further sustainability investments.")
-    elif cost >= 70:
-        narratives.append("Operating costs have risen, putting pressure on the budget and limiting future initiatives.")
 
-    # Operational state
-    if efficiency >= 70:
-        narratives.append("Operations run smoothly with optimized processes and well-trained staff.")
-    elif efficiency <= 30:
-        narratives.append("Operational inefficiencies are creating bottlenecks and staff frustration.")
+@lru_cache(maxsize=4096)
+def _compose_narrative(score_bucket: int, metric_buckets: Tuple[int, ...], option_label: str) -> str:
+    """
+    Assemble the narrative text for a bucketed business state (cached).
 
-    # Stakeholder relations
-    if trust >= 70:
-        narratives.append("Student satisfaction is high, with strong community support for sustainability initiatives.")
-    elif trust <= 30:
-        narratives.append("Stakeholder trust is low, with concerns about transparency and commitment to change.")
+    Args:
+        score_bucket: Index into _SCORE_NARRATIVES
+        metric_buckets: Per-metric bucket ids, aligned with _METRIC_NARRATIVES
+        option_label: Label of the chosen option
 
-    # Add context from the decision
-    decision_context = f"Your recent decision to {option['label'].lower()} has reshaped operations."
-    narratives.insert(1, decision_context)
+    Returns:
+        The narrative string
+    """
+    # Overall assessment, then context from the decision, then per-metric state
+    parts = [
+        _SCORE_NARRATIVES[score_bucket],
+        f"Your recent decision to {option_label.lower()} has reshaped operations.",
+    ]
+    parts.extend(
+        texts[bucket] for (_, texts), bucket in zip(_METRIC_NARRATIVES, metric_buckets)
+        if texts[bucket]
+    )
 
-    return " ".join(narratives)
+    return " ".join(parts)
 
 
 @app.post("/api/apply-decision", response_model=ApplyDecisionResponse)
-async def apply_decision(request: ApplyDecisionRequest):
+def apply_decision(request: ApplyDecisionRequest):
     """
     Apply a chosen decision option to current metrics.
 
@@ -221,19 +406,21 @@ async def apply_decision(request: ApplyDecisionRequest):
         raise HTTPException(status_code=404, detail=f"Card '{request.cardId}' not found")
 
     # Find the option
-    option = next((opt for opt in card["options"] if opt["id"] == request.optionId), None)
+    option = cards.get_option(card, request.optionId)
     if not option:
         raise HTTPException(status_code=404, detail=f"Option '{request.optionId}' not found in card '{request.cardId}'")
 
     # Apply deltas
-    metrics_dict = request.currentMetrics.model_dump(by_alias=True)
+    metrics_dict = metrics_to_dict(request.currentMetrics)
     new_metrics_dict = simulate.apply_deltas(metrics_dict, option["deltas"])
 
-    # Convert to Pydantic model
-    new_metrics = MetricsState(**new_metrics_dict)
+    # Convert to Pydantic model (apply_deltas already clamps to 0-100)
+    new_metrics = MetricsState.model_construct(**new_metrics_dict)
 
     # Generate business state narrative
-    business_state = generate_business_state_narrative(card, option, new_metrics_dict)
+    business_state = generate_business_state_narrative(
+        card, option, NarrativeMetrics.from_dict(new_metrics_dict)
+    )
 
     return ApplyDecisionResponse(
         newMetrics=new_metrics,
@@ -245,7 +432,7 @@ async def apply_decision(request: ApplyDecisionRequest):
 # ==================== Autopilot Simulation ====================
 
 @app.post("/api/simulate-autopilot", response_model=SimulateAutopilotResponse)
-async def simulate_autopilot(request: SimulateAutopilotRequest):
+def simulate_autopilot(request: SimulateAutopilotRequest):
     """
     Run full autopilot simulation.
 
@@ -261,9 +448,10 @@ async def simulate_autopilot(request: SimulateAutopilotRequest):
         HTTPException: If simulation fails
     """
     # Convert to dict
-    initial_metrics_dict = request.initialMetrics.model_dump(by_alias=True)
+    initial_metrics_dict = metrics_to_dict(request.initialMetrics)
 
-    # Run simulation
+    # Run simulation. Autopilot uses the algorithmic scorer only (no Gemini or
+    # ESG-BERT calls), so it is pure CPU work with no I/O to run concurrently
     try:
         nodes_data = simulate.simulate_full_run(
             initial_metrics=initial_metrics_dict,
@@ -278,25 +466,12 @@ async def simulate_autopilot(request: SimulateAutopilotRequest):
     if not nodes_data:
         raise HTTPException(status_code=404, detail="No eligible cards for simulation")
 
-    # Convert to Pydantic models
-    nodes = []
-    for node_data in nodes_data:
-        node = TimelineNodeResponse(
-            step=node_data["step"],
-            cardId=node_data["cardId"],
-            chosenOptionId=node_data["chosenOptionId"],
-            metricsAfter=MetricsState(**node_data["metricsAfter"]),
-            explanation=node_data["explanation"]
-        )
-        nodes.append(node)
-
-    # Final metrics = last node's metrics
-    final_metrics = nodes[-1].metricsAfter
-
-    return SimulateAutopilotResponse(
-        nodes=nodes,
-        finalMetrics=final_metrics
-    )
+    # Simulation nodes already have the TimelineNodeResponse shape, so skip
+    # model construction and serialize the response in a single orjson pass
+    return ORJSONResponse({
+        "nodes": nodes_data,
+        "finalMetrics": nodes_data[-1]["metricsAfter"]  # Final metrics = last node's metrics
+    })
 
 
 # ==================== Card Retrieval ====================
@@ -319,11 +494,50 @@ async def get_card(card_id: str):
     if not card:
         raise HTTPException(status_code=404, detail=f"Card not found: {card_id}")
 
-    return DecisionCard(**card)
+    return _card_model(card_id)
+
+
+@lru_cache(maxsize=None)
+def _card_model(card_id: str) -> DecisionCard:
+    """
+    Build the DecisionCard for a library card (cached per card id).
+
+    Library cards are static and checked by cards.validate_cards() at
+    startup, so the model is built once with model_construct and reused.
+    Nested options/triggers are constructed explicitly so serialization
+    sees model instances rather than dicts. Only call with ids known to
+    exist, and never for untrusted input such as Gemini-generated cards.
+
+    Args:
+        card_id: Id of a card in the card library
+
+    Returns:
+        DecisionCard model
+    """
+    card = cards.get_card_by_id(card_id)
+    triggers = card.get("triggers")
+    return DecisionCard.model_construct(
+        id=card["id"],
+        title=card["title"],
+        prompt=card["prompt"],
+        tags=card["tags"],
+        severity=card["severity"],
+        triggers=DecisionTriggers.model_construct(**triggers) if triggers else None,
+        options=[DecisionOption.model_construct(**option) for option in card["options"]],
+    )
 
 
 # ==================== Custom Card Generation ====================
 
+# Scaling note returned with custom-card metrics
+_SCALING_TEMPLATE = """
+Metrics scaled for {size} {industry} company.
+Starting conditions adjusted based on stated challenges.
+Company: {company_name}
+Operational scale: {operational_scale}
+"""
+
+
 @app.post("/api/generate-custom-cards", response_model=GenerateCustomCardsResponse)
 async def generate_custom_cards(request: GenerateCustomCardsRequest):
     """
@@ -341,8 +555,8 @@ async def generate_custom_cards(request: GenerateCustomCardsRequest):
     try:
         profile_dict = request.companyProfile.model_dump()
 
-        # Generate custom cards using Gemini
-        custom_cards = gemini.generate_custom_cards(
+        # Generate custom cards using Gemini (async SDK call, keeps the loop free)
+        custom_cards = await gemini.generate_custom_cards_async(
             company_profile=profile_dict,
             number_of_cards=request.numberOfCards,
             focus_areas=request.focusAreas
@@ -357,12 +571,13 @@ async def generate_custom_cards(request: GenerateCustomCardsRequest):
         # Calculate customized initial metrics
         initial_metrics = gemini.calculate_custom_initial_metrics(profile_dict)
 
-        scaling_context = f"""
-Metrics scaled for {request.companyProfile.size} {request.companyProfile.industry} company.
-Starting conditions adjusted based on stated challenges.
-Company: {request.companyProfile.companyName}
-Operational scale: {request.companyProfile.customMetrics.operationalScale if request.companyProfile.customMetrics else 'Standard'}
-"""
+        custom_metrics = profile_dict["customMetrics"]
+        scaling_context = _SCALING_TEMPLATE.format(
+            size=profile_dict["size"],
+            industry=profile_dict["industry"],
+            company_name=profile_dict["companyName"],
+            operational_scale=custom_metrics["operationalScale"] if custom_metrics else "Standard",
+        )
 
         return GenerateCustomCardsResponse(
             cards=[DecisionCard(**card) for card in custom_cards],
@@ -401,31 +616,16 @@ async def extract_pdf(file: UploadFile = File(...)):
             detail="Only PDF files are supported"
         )
 
-    try:
-        # Read PDF file
-        pdf_bytes = await file.read()
-
-        # Extract text using PyMuPDF
-        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-
-        extracted_text = ""
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            extracted_text += page.get_text()
-
-        doc.close()
+    # Reject oversized uploads before parsing them
+    pdf_file = await _checked_upload_file(file, MAX_PDF_BYTES)
 
-        # Clean up text (remove excessive whitespace)
-        extracted_text = " ".join(extracted_text.split())
-
-        # Limit to reasonable length (for AI processing)
-        max_length = 5000  # characters
-        if len(extracted_text) > max_length:
-            extracted_text = extracted_text[:max_length] + "..."
+    try:
+        # Parsing is CPU-bound, so run it off the event loop
+        extracted_text, page_count = await anyio.to_thread.run_sync(_extract_pdf_text, pdf_file)
 
         return {
             "extractedText": extracted_text,
-            "pageCount": len(doc),
+            "pageCount": page_count,
             "filename": file.filename
         }
 
@@ -436,10 +636,88 @@ async def extract_pdf(file: UploadFile = File(...)):
         )
 
 
+async def _checked_upload_file(file: UploadFile, max_bytes: int) -> BinaryIO:
+    """
+    Enforce a size limit on an upload and return its underlying file.
+
+    Starlette already spools uploads to a temp file, so that file is
+    passed through as-is rather than copied again.
+
+    Args:
+        file: Uploaded file
+        max_bytes: Maximum accepted size
+
+    Returns:
+        The upload's file object, positioned at the start
+
+    Raises:
+        HTTPException: 413 if the upload is larger than max_bytes
+    """
+    size = file.size
+    if size is None:
+        size = file.file.seek(0, os.SEEK_END)
+
+    if size > max_bytes:
+        raise HTTPException(status_code=413, detail=f"PDF too large (max {max_bytes // (1024 * 1024)} MB)")
+
+    await file.seek(0)
+    return file.file
+
+
+def _extract_pdf_text(pdf_file: BinaryIO) -> Tuple[str, int]:
+    """
+    Extract and clean text from a PDF file (blocking; run in a worker thread).
+
+    Pages are read only until the cleaned text exceeds PDF_TEXT_MAX_CHARS,
+    since everything after that is truncated anyway.
+
+    Args:
+        pdf_file: Readable binary file with the PDF content
+
+    Returns:
+        Tuple of (extracted_text, page_count)
+    """
+    # Extract text using PyMuPDF (the context manager closes the document
+    # even if a page fails to parse)
+    parts = []
+    with fitz.open(stream=pdf_file.read(), filetype="pdf") as doc:
+        page_count = doc.page_count
+
+        # Running length of the cleaned text so far. Each page is collapsed
+        # once as it is read; pages join with one space only when whitespace
+        # separates them (otherwise words run together, as in the full join)
+        cleaned_length = 0
+        pending_space = False
+        for page in doc:
+            text = page.get_text("text")
+            parts.append(text)
+
+            cleaned = _WHITESPACE_RE.sub(" ", text).strip()
+            if cleaned:
+                if cleaned_length and (pending_space or text[0].isspace()):
+                    cleaned_length += 1
+                cleaned_length += len(cleaned)
+                pending_space = text[-1].isspace()
+            elif text:
+                pending_space = True  # Whitespace-only page
+
+            if cleaned_length > PDF_TEXT_MAX_CHARS:
+                break
+
+    # Clean up text (remove excessive whitespace)
+    extracted_text = _WHITESPACE_RE.sub(" ", "".join(parts)).strip()
+
+    # Limit to reasonable length (for AI processing)
+    if len(extracted_text) > PDF_TEXT_MAX_CHARS:
+        extracted_text = extracted_text[:PDF_TEXT_MAX_CHARS] + "..."
+
+    return extracted_text, page_count
+
+
 # ==================== Impact Report ====================
 
 @app.post("/api/calculate-impact")
-async def calculate_impact(
+def calculate_impact(
     timeline_nodes: List[dict],
     final_metrics: MetricsState
 ):
@@ -460,7 +738,7 @@ async def calculate_impact(
         # Generate narrative
         narrative = impact_tracker.generate_impact_narrative(
             impact,
-            final_metrics.model_dump()
+            metrics_to_dict(final_metrics)
         )
 
         return {
@@ -476,6 +754,72 @@ async def calculate_impact(
         )
 
 
+# ==================== Batch ====================
+
+# Batchable endpoints: url -> (request model, sync handler)
+BATCH_ROUTES = {
+    "/api/generate-decision": (GenerateDecisionRequest, generate_decision),
+    "/api/apply-decision": (ApplyDecisionRequest, apply_decision),
+    "/api/simulate-autopilot": (SimulateAutopilotRequest, simulate_autopilot),
+}
+
+
+@app.post("/api/batch", response_model=BatchResponse)
+async def batch(request: BatchRequest):
+    """
+    Run several independent API calls in one round-trip.
+
+    Sub-requests are validated and dispatched in-process (no HTTP layer) and
+    run concurrently, so they must not depend on each other's results.
+
+    Args:
+        request: List of sub-requests with id, url and JSON body
+
+    Returns:
+        One {id, status, body} result per sub-request, in request order
+    """
+    responses = await asyncio.gather(*(_run_sub_request(sub) for sub in request.requests))
+    return BatchResponse(responses=responses)
+
+
+async def _run_sub_request(sub: SubRequest) -> SubResponse:
+    """
+    Validate and run a single batched call, mapping errors to status codes.
+
+    Args:
+        sub: The sub-request
+
+    Returns:
+        SubResponse with the handler's JSON body or an error detail
+    """
+    route = BATCH_ROUTES.get(sub.url)
+    if route is None:
+        return SubResponse(id=sub.id, status=404, body={"detail": f"Unsupported batch url: {sub.url}"})
+
+    request_model, handler = route
+    try:
+        parsed = request_model.model_validate(sub.body)
+    except ValidationError as e:
+        return SubResponse(id=sub.id, status=422, body={"detail": e.errors(include_url=False, include_context=False)})
+
+    try:
+        result = await run_in_threadpool(handler, parsed)
+    except HTTPException as e:
+        return SubResponse(id=sub.id, status=e.status_code, body={"detail": e.detail})
+    except Exception as e:
+        # Isolate failures so the other sub-requests still return their results
+        print(f"Batch sub-request {sub.id} ({sub.url}) failed: {e}")
+        return SubResponse(id=sub.id, status=500, body={"detail": "Internal error"})
+
+    if isinstance(result, Response):
+        # Handlers that pre-serialize their payload (e.g. simulate-autopilot)
+        body = orjson.loads(result.body)
+    else:
+        body = result.model_dump(mode="json", by_alias=True)
+
+    return SubResponse(id=sub.id, status=200, body=body)
+
+
 # ==================== Root Endpoint ====================
 
 @app.get("/")
@@ -490,7 +834,8 @@ async def root():
             "generateDecision": "POST /api/generate-decision",
             "applyDecision": "POST /api/apply-decision",
             "simulateAutopilot": "POST /api/simulate-autopilot",
-            "getCard": "GET /api/cards/{card_id}"
+            "getCard": "GET /api/cards/{card_id}",
+            "batch": "POST /api/batch"
         },
         "docs": "/docs",
         "redoc": "/redoc"
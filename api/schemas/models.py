@@ -64,7 +64,7 @@ class DecisionCard(BaseModel):
 class GenerateDecisionRequest(BaseModel):
     """Request to generate next decision"""
     currentMetrics: MetricsState
-    usedCardIds: List[str] = Field(default_factory=list)
+    usedCardIds: set[str] = Field(default_factory=set)  # Set: scoring only tests membership
     step: int = Field(ge=0, le=10)
     seed: Optional[int] = None
 
@@ -107,7 +107,7 @@ class SimulateAutopilotRequest(BaseModel):
     initialMetrics: MetricsState
     steps: int = Field(ge=1, le=10)
     startStep: int = Field(default=1, ge=0, le=10, description="Step number to start from (for branched threads)")
-    usedCardIds: List[str] = Field(default_factory=list, description="Cards already used in this timeline")
+    usedCardIds: set[str] = Field(default_factory=set, description="Cards already used in this timeline")
     seed: Optional[int] = None
 
 
@@ -170,3 +170,30 @@ class GenerateCustomCardsResponse(BaseModel):
     customizedMetrics: Dict[str, Any] = Field(
         description="Initial metrics and scaling context"
     )
+
+
+# ==================== Batch Models ====================
+
+class SubRequest(BaseModel):
+    """Single API call inside a batch"""
+    id: str
+    url: str
+    method: Literal['POST'] = 'POST'
+    body: Dict[str, Any] = Field(default_factory=dict)
+
+
+class BatchRequest(BaseModel):
+    """Several independent API calls dispatched in one round-trip"""
+    requests: List[SubRequest] = Field(min_length=1, max_length=50)
+
+
+class SubResponse(BaseModel):
+    """Result of one batched call"""
+    id: str
+    status: int
+    body: Any
+
+
+class BatchResponse(BaseModel):
+    """Results in the same order as the batch's requests"""
+    responses: List[SubResponse]
@@ -0,0 +1,10 @@
+"""
+Pytest configuration: make the api package modules (main, engine, schemas)
+importable the same way uvicorn loads them.
+"""
+import sys
+from pathlib import Path
+
+API_DIR = Path(__file__).parent.parent
+if str(API_DIR) not in sys.path:
+    sys.path.insert(0, str(API_DIR))
@@ -0,0 +1,71 @@
+"""
+Tests for batched Gemini validation caching in engine.ai_engine.
+"""
+import json
+
+import pytest
+
+from engine import ai_engine
+
+CARDS = [
+    {"id": "card_a", "title": "Recycling", "prompt": "Start recycling?", "tags": ["waste"], "severity": "easy"},
+    {"id": "card_b", "title": "Solar", "prompt": "Install solar?", "tags": ["emissions"], "severity": "hard"},
+]
+
+METRICS = {
+    "waste": 60,
+    "emissions": 50,
+    "cost": 40,
+    "efficiency": 50,
+    "communityTrust": 50,
+    "sustainabilityScore": 50,
+}
+
+PARTIAL = json.dumps([{"index": 1, "confidence": 0.8, "reasoning": "Waste is high"}])
+FULL = json.dumps([
+    {"index": 1, "confidence": 0.8, "reasoning": "Waste is high"},
+    {"index": 2, "confidence": 0.9, "reasoning": "Emissions matter", "priority_level": "high"},
+])
+
+
+class FakeModel:
+    """Stand-in for genai.GenerativeModel that replays canned responses."""
+
+    def __init__(self, *texts):
+        self.texts = list(texts)
+        self.calls = 0
+
+    def generate_content(self, prompt, generation_config=None):
+        text = self.texts[self.calls]
+        self.calls += 1
+        return type("Response", (), {"text": text})()
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    # Skip the ESG-BERT warm-up thread; these tests only touch Gemini
+    monkeypatch.setattr(ai_engine.AIDecisionEngine, "_warm_up", lambda self: None)
+    return ai_engine.AIDecisionEngine()
+
+
+def test_partial_batch_is_retried(engine):
+    engine.gemini_model = FakeModel(PARTIAL, FULL)
+
+    results = engine.validate_cards_batch(CARDS, METRICS, max_retries=2)
+
+    assert engine.gemini_model.calls == 2
+    assert [r["confidence"] for r in results] == [0.8, 0.9]
+    assert results[1]["priority_level"] == "high"
+
+
+def test_partial_batch_is_not_cached(engine):
+    engine.gemini_model = FakeModel(PARTIAL, FULL)
+
+    first = engine.validate_cards_batch(CARDS, METRICS)
+    second = engine.validate_cards_batch(CARDS, METRICS)
+    third = engine.validate_cards_batch(CARDS, METRICS)
+
+    assert first == [ai_engine._fallback_validation(card) for card in CARDS]
+    assert engine.gemini_model.calls == 2  # The full response is cached
+    assert second == third
+    assert [r["confidence"] for r in second] == [0.8, 0.9]
@@ -0,0 +1,64 @@
+"""
+Tests for the /api/batch endpoint.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+METRICS = {
+    "waste": 60,
+    "emissions": 50,
+    "cost": 40,
+    "efficiency": 50,
+    "communityTrust": 50,
+    "sustainabilityScore": 50,
+}
+
+
+@pytest.fixture
+def client():
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+def test_failing_sub_request_does_not_fail_batch(client, monkeypatch):
+    def failing_generate_decision(request):
+        raise RuntimeError("engine exploded")
+
+    monkeypatch.setitem(
+        main.BATCH_ROUTES,
+        "/api/generate-decision",
+        (main.GenerateDecisionRequest, failing_generate_decision),
+    )
+
+    response = client.post("/api/batch", json={"requests": [
+        {"id": "apply", "url": "/api/apply-decision", "body": {
+            "currentMetrics": METRICS, "cardId": "packaging-policy", "optionId": "reusable",
+        }},
+        {"id": "generate", "url": "/api/generate-decision", "body": {
+            "currentMetrics": METRICS, "step": 1, "seed": 1,
+        }},
+        {"id": "autopilot", "url": "/api/simulate-autopilot", "body": {
+            "initialMetrics": METRICS, "steps": 2, "seed": 3,
+        }},
+    ]})
+
+    assert response.status_code == 200
+    results = {r["id"]: r for r in response.json()["responses"]}
+    assert results["generate"]["status"] == 500
+    assert results["generate"]["body"] == {"detail": "Internal error"}
+    assert results["apply"]["status"] == 200
+    assert "newMetrics" in results["apply"]["body"]
+    assert results["autopilot"]["status"] == 200
+    assert len(results["autopilot"]["body"]["nodes"]) == 2
+
+
+def test_unknown_url_and_invalid_body(client):
+    response = client.post("/api/batch", json={"requests": [
+        {"id": "missing", "url": "/api/nope", "body": {}},
+        {"id": "invalid", "url": "/api/apply-decision", "body": {"cardId": "x"}},
+    ]})
+
+    results = {r["id"]: r["status"] for r in response.json()["responses"]}
+    assert results == {"missing": 404, "invalid": 422}
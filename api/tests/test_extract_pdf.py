@@ -0,0 +1,70 @@
+"""
+Tests for PDF text extraction (main._extract_pdf_text).
+"""
+import io
+
+import fitz
+import pytest
+
+import main
+
+
+def _make_pdf(pages):
+    """Build an in-memory PDF with one text line per entry of `pages`."""
+    doc = fitz.open()
+    for lines in pages:
+        page = doc.new_page()
+        y = 40
+        for line in lines:
+            page.insert_text((40, y), line)
+            y += 14
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def _full_extraction(pdf_bytes):
+    """Reference: extract every page, then collapse whitespace and truncate."""
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        text = "".join(page.get_text("text") for page in doc)
+        page_count = doc.page_count
+    text = " ".join(text.split())
+    if len(text) > main.PDF_TEXT_MAX_CHARS:
+        text = text[:main.PDF_TEXT_MAX_CHARS] + "..."
+    return text, page_count
+
+
+@pytest.fixture
+def count_get_text(monkeypatch):
+    """Count how many pages get_text() is called on."""
+    calls = []
+    original = fitz.Page.get_text
+
+    def counting_get_text(self, *args, **kwargs):
+        calls.append(self.number)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(fitz.Page, "get_text", counting_get_text)
+    return calls
+
+
+def test_short_pdf_matches_full_extraction():
+    pdf_bytes = _make_pdf([["Hello    PDF", "  world  "], ["second page"]])
+
+    assert main._extract_pdf_text(io.BytesIO(pdf_bytes)) == _full_extraction(pdf_bytes)
+
+
+def test_whitespace_heavy_pages_stop_early(count_get_text):
+    # Each page has lots of raw whitespace but only ~60 visible characters
+    page = ["word" + " " * 40 + "word" + " " * 40 + "word"] * 5
+    pdf_bytes = _make_pdf([page] * 400)
+    expected = _full_extraction(pdf_bytes)
+    count_get_text.clear()
+
+    text, page_count = main._extract_pdf_text(io.BytesIO(pdf_bytes))
+
+    assert (text, page_count) == expected
+    assert text.endswith("...")
+    # Stops shortly after the cleaned budget is reached, not at the last page
+    assert len(count_get_text) < page_count
+    assert len(count_get_text) <= main.PDF_TEXT_MAX_CHARS // 60 + 2
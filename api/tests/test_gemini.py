@@ -0,0 +1,56 @@
+"""
+Tests for coalesced async card generation in engine.gemini.
+"""
+import asyncio
+
+import pytest
+
+from engine import gemini
+
+CARDS_JSON = """[
+    {
+        "id": "custom_1",
+        "title": "Packaging",
+        "options": [{"id": "a", "label": "Switch to recycled packaging"}]
+    }
+]"""
+
+PROFILE = {"name": "Acme", "industry": "retail", "size": "small"}
+
+
+class FakeModel:
+    """Stand-in for genai.GenerativeModel that counts async requests."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_content_async(self, prompt):
+        self.calls += 1
+        await asyncio.sleep(0.01)  # Keep the request in flight for both callers
+        return type("Response", (), {"text": CARDS_JSON})()
+
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    model = FakeModel()
+    monkeypatch.setattr(gemini, "GEMINI_API_KEY", "test-key")
+    monkeypatch.setattr(gemini, "_gen_model", model)
+    return model
+
+
+def test_concurrent_callers_get_independent_cards(fake_model):
+    async def run():
+        return await asyncio.gather(
+            gemini.generate_custom_cards_async(PROFILE, number_of_cards=1),
+            gemini.generate_custom_cards_async(PROFILE, number_of_cards=1),
+        )
+
+    first, second = asyncio.run(run())
+
+    assert fake_model.calls == 1
+    assert first == second
+
+    first[0]["options"][0]["label"] = "changed"
+    first[0]["options"].append({"id": "b", "label": "extra"})
+
+    assert second[0]["options"] == [{"id": "a", "label": "Switch to recycled packaging"}]